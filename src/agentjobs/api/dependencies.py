@@ -12,6 +12,7 @@ from fastapi.templating import Jinja2Templates
 
 from agentjobs.manager import TaskManager
 from agentjobs.storage import TaskStorage, WebhookStorage
+from agentjobs.utils.yaml_safe import SafeLoader
 from agentjobs.webhooks import WebhookManager
 
 TASKS_DIR_ENV = "AGENTJOBS_TASKS_DIR"
@@ -34,7 +35,7 @@ def _load_config(base_dir: Path) -> dict:
     if not config_path.exists():
         return {}
     content = config_path.read_text(encoding="utf-8")
-    return yaml.safe_load(content) or {}
+    return yaml.load(content, Loader=SafeLoader) or {}
 
 
 def _resolve_tasks_dir() -> Path:
@@ -69,7 +70,11 @@ def _get_storage() -> TaskStorage:
 def _get_webhook_storage() -> WebhookStorage:
     """Create a cached WebhookStorage instance."""
     base_dir = _resolve_project_root()
-    webhooks_path = base_dir / ".agentjobs" / "webhooks.yaml"
+    webhooks_path = base_dir / ".agentjobs" / "webhooks.jsonl"
+    legacy_path = webhooks_path.with_suffix(".yaml")
+    if legacy_path.exists() and not webhooks_path.exists():
+        # WebhookStorage reads the old YAML list and converts it on next write.
+        legacy_path.rename(webhooks_path)
     return WebhookStorage(webhooks_path)
 
 
@@ -89,6 +94,12 @@ def get_webhook_manager() -> WebhookManager:
     return _get_webhook_manager()
 
 
+async def close_webhook_manager() -> None:
+    """Release the cached WebhookManager's HTTP client, if one was created."""
+    if _get_webhook_manager.cache_info().currsize:
+        await _get_webhook_manager().aclose()
+
+
 def get_templates() -> Jinja2Templates:
     """Provide a shared Jinja2Templates instance for web views."""
     global _TEMPLATES
@@ -100,6 +111,8 @@ def get_templates() -> Jinja2Templates:
 
 def reset_dependency_cache() -> None:
     """Clear cached storage when environment configuration changes."""
+    if _get_webhook_manager.cache_info().currsize:
+        _get_webhook_manager().close()
     _get_storage.cache_clear()
     _get_webhook_storage.cache_clear()
     _get_webhook_manager.cache_clear()
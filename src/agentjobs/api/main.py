@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
@@ -12,6 +13,7 @@ from starlette import status
 
 from agentjobs.__version__ import __version__
 
+from .dependencies import close_webhook_manager
 from .routes import (
     health_router,
     prompts_router,
@@ -27,12 +29,21 @@ DESCRIPTION = (
     "management, status tracking, prompt coordination, and search."
 )
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Release webhook delivery resources when the server shuts down."""
+    yield
+    await close_webhook_manager()
+
+
 app = FastAPI(
     title="AgentJobs API",
     description=DESCRIPTION,
     version=__version__,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
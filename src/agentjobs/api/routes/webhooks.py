@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel, Field, HttpUrl
 
-from agentjobs.models import Webhook
+from agentjobs.models import TaskField, Webhook
 from agentjobs.webhooks import WebhookManager
 
 from ..dependencies import get_webhook_manager
@@ -22,6 +23,9 @@ class WebhookCreateRequest(BaseModel):
     events: List[str] = Field(..., description="Events to subscribe to")
     secret: str = Field(..., description="Secret for HMAC verification")
     active: bool = Field(default=True, description="Whether webhook is active")
+    fields: Optional[List[TaskField]] = Field(
+        default=None, description="Task fields to include in payloads (default: all)"
+    )
 
 
 @router.get("", response_model=List[Webhook])
@@ -58,6 +62,7 @@ async def create_webhook(
         events=payload.events,
         secret=payload.secret,
         active=payload.active,
+        fields=payload.fields,
     )
 
 
@@ -83,7 +88,8 @@ async def test_webhook(
 ) -> Dict[str, Any]:
     """Send a test event to a webhook."""
     try:
-        webhook_manager.test_webhook(webhook_id)
+        # test_webhook waits for the delivery, so keep it off the event loop.
+        await asyncio.to_thread(webhook_manager.test_webhook, webhook_id)
         return {"status": "ok", "message": f"Test event sent to webhook {webhook_id}"}
     except ValueError as exc:
         raise HTTPException(
@@ -15,7 +15,8 @@ from .manager import TaskManager
 from .migration import migrate_tasks
 from .migration.reporter import MigrationReporter
 from .models import Priority, TaskStatus
-from .storage import TaskStorage
+from .storage import INDEX_FILENAME, TaskStorage
+from .utils.yaml_safe import SafeDumper, SafeLoader
 
 
 def _make_output_encoding_safe() -> None:
@@ -78,14 +79,16 @@ def _load_config(base_dir: Path) -> dict:
     if not config_path.exists():
         return copy.deepcopy(DEFAULT_CONFIG)
     content = config_path.read_text(encoding="utf-8")
-    return yaml.safe_load(content) or copy.deepcopy(DEFAULT_CONFIG)
+    return yaml.load(content, Loader=SafeLoader) or copy.deepcopy(DEFAULT_CONFIG)
 
 
 def _save_config(base_dir: Path, config: dict) -> None:
     """Persist AgentJobs configuration to disk."""
     config_path = base_dir / CONFIG_FILE
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_yaml = yaml.safe_dump(config, sort_keys=False, allow_unicode=False)
+    config_yaml = yaml.dump(
+        config, Dumper=SafeDumper, sort_keys=False, allow_unicode=False
+    )
     config_path.write_text(config_yaml, encoding="utf-8")
 
 
@@ -94,10 +97,11 @@ def _ensure_gitignore(base_dir: Path) -> None:
     gitignore_path = base_dir / ".gitignore"
     if not gitignore_path.exists():
         return
-    entry = ".agentjobs/agentjobs.db"
+    entries = [".agentjobs/agentjobs.db", INDEX_FILENAME]
     lines = gitignore_path.read_text(encoding="utf-8").splitlines()
-    if entry not in lines:
-        lines.append(entry)
+    missing = [entry for entry in entries if entry not in lines]
+    if missing:
+        lines.extend(missing)
         gitignore_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
@@ -226,9 +226,11 @@ class TaskManager:
     ) -> Task:
         """Mark deliverable as completed."""
         task = self._ensure_task_exists(task_id)
-        for deliverable in task.deliverables:
+        for index, deliverable in enumerate(task.deliverables):
             if deliverable.path == deliverable_path:
-                deliverable.status = "completed"
+                task.deliverables[index] = deliverable.model_copy(
+                    update={"status": "completed"}
+                )
                 break
         else:
             raise ValueError(
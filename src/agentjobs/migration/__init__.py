@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import glob
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Sequence
+from typing import List, Sequence, Tuple
 
-from agentjobs.storage import TaskStorage
+from agentjobs.models import Task
+from agentjobs.storage import TaskSaveError, TaskStorage
 
 from .converter import TaskConverter
-from .parser import MarkdownTaskParser
+from .parser import MarkdownTaskParser, ParsedTask
 from .reporter import MigrationResult
 
 __all__ = ["migrate_tasks", "MigrationResult"]
 
+# Upper bound on concurrent file reads while parsing source markdown.
+_MAX_PARSE_WORKERS = 8
+
 
 def _collect_source_files(source_patterns: Sequence[str]) -> List[Path]:
     """Expand glob patterns into a de-duplicated list of files."""
@@ -57,11 +62,25 @@ def migrate_tasks(
     storage = TaskStorage(target_path) if not dry_run else None
 
     results: List[MigrationResult] = []
-    source_files = _collect_source_files(source_patterns)
-
-    for source_file in sorted(source_files):
+    source_files = sorted(_collect_source_files(source_patterns))
+    if not source_files:
+        return results
+
+    # Parsing is independent per file, so overlap the reads; conversion stays
+    # sequential to keep result ordering simple, and the converted tasks are
+    # written in one batch at the end; a failed batch marks every result it
+    # did not write as failed.
+    workers = min(_MAX_PARSE_WORKERS, len(source_files))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: List[Future[ParsedTask]] = [
+            executor.submit(parser.parse_file, source_file)
+            for source_file in source_files
+        ]
+
+    converted: List[Tuple[Task, MigrationResult]] = []
+    for source_file, parse_future in zip(source_files, pending):
         try:
-            parsed = parser.parse_file(source_file)
+            parsed = parse_future.result()
             task = converter.convert(parsed, prompts_dir=prompts_path)
 
             warnings: List[str] = []
@@ -72,19 +91,15 @@ def migrate_tasks(
             if not task.phases and not task.deliverables:
                 warnings.append("No phases or deliverables extracted")
 
-            target_file = target_path / f"{task.id}.yaml"
-            if not dry_run and storage is not None:
-                storage.save_task(task)
-
-            results.append(
-                MigrationResult(
-                    source_file=source_file,
-                    task_id=task.id,
-                    success=True,
-                    target_file=target_file,
-                    warnings=warnings,
-                )
+            result = MigrationResult(
+                source_file=source_file,
+                task_id=task.id,
+                success=True,
+                target_file=target_path / f"{task.id}.yaml",
+                warnings=warnings,
             )
+            converted.append((task, result))
+            results.append(result)
         except Exception as exc:  # pragma: no cover - defensive branch
             results.append(
                 MigrationResult(
@@ -95,5 +110,17 @@ def migrate_tasks(
                 )
             )
 
+    if storage is not None:
+        try:
+            storage.save_tasks_bulk(task for task, _ in converted)
+        except TaskSaveError as exc:
+            for task, result in converted:
+                if task.id in exc.written:
+                    continue
+                result.success = False
+                result.target_file = None
+                result.errors.append(
+                    str(exc) if task.id == exc.task_id else f"Not written: {exc}"
+                )
     return results
 
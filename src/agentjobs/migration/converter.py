@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
@@ -64,26 +65,31 @@ class TaskConverter:
         status = self._map_status(parsed.status)
         priority = self._map_priority(parsed.priority)
 
-        phases = [
+        # Tuples are handed straight to pydantic, which accepts any sequence for
+        # list fields; bound methods are hoisted out of the per-item loops.
+        map_status = self._map_status
+        derive_path = self._derive_deliverable_path
+
+        phases = tuple(
             Phase(
                 id=phase["id"],
                 title=phase["title"],
-                status=self._map_status(phase.get("status")),
+                status=map_status(phase.get("status")),
                 notes=phase.get("notes"),
             )
             for phase in parsed.phases
             if "id" in phase and "title" in phase
-        ]
+        )
 
-        deliverables = [
+        deliverables = tuple(
             Deliverable(
-                path=self._derive_deliverable_path(deliverable),
+                path=derive_path(deliverable),
                 description=deliverable.get("description"),
                 status=deliverable.get("status", "pending"),
             )
             for deliverable in parsed.deliverables
             if deliverable.get("description")
-        ]
+        )
 
         description = self._build_description(parsed)
         prompts = self._find_prompts(parsed, prompts_dir, fallback=description)
@@ -120,12 +126,10 @@ class TaskConverter:
             segments.append(parsed.description.strip())
 
         if parsed.objectives:
-            objective_lines = "\n".join(f"- {item}" for item in parsed.objectives)
-            segments.append(f"## Objectives\n{objective_lines}")
+            segments.append("## Objectives\n- " + "\n- ".join(parsed.objectives))
 
         if parsed.issues:
-            issue_lines = "\n".join(f"- {item}" for item in parsed.issues)
-            segments.append(f"## Issues\n{issue_lines}")
+            segments.append("## Issues\n- " + "\n- ".join(parsed.issues))
 
         if parsed.notes:
             segments.append(parsed.notes.strip())
@@ -184,12 +188,22 @@ class TaskConverter:
         if task_number is None:
             return Prompts(starter=fallback or parsed.raw_content[:500])
 
-        pattern = f"task-{task_number}-*.md"
-        prompt_files = sorted(prompts_dir.glob(pattern))
-        if not prompt_files:
+        prefix = f"task-{task_number}-"
+        try:
+            with os.scandir(prompts_dir) as entries:
+                prompt_names = sorted(
+                    entry.name
+                    for entry in entries
+                    if entry.name.startswith(prefix)
+                    and entry.name.endswith(".md")
+                    and entry.is_file()
+                )
+        except OSError:
+            prompt_names = []
+        if not prompt_names:
             return Prompts(starter=fallback or parsed.raw_content[:500])
 
-        starter_file = prompt_files[0]
+        starter_file = Path(prompts_dir) / prompt_names[0]
         try:
             starter_content = starter_file.read_text(encoding="utf-8")
         except OSError:
@@ -7,6 +7,46 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Inline code, bold, and italic spans stripped by ``_clean_markdown`` in one pass.
+_INLINE_MARKUP_RE = re.compile(r"`([^`]+)`|\*\*(.+?)\*\*|\*(.+?)\*")
+
+# Fixed patterns are compiled once here; only the per-heading section patterns
+# are built at parse time.
+_TITLE_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+_BOLD_TEXT_RE = re.compile(r"\*\*([^*]+)\*\*")
+_CODE_RE = re.compile(r"`([^`]+)`")
+_UNDERSCORE_BOLD_RE = re.compile(r"__([^_]+)__")
+_MARKUP_CHARS_RE = re.compile(r"[`*#_]")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_SUMMARY_RES = [
+    re.compile(rf"##\s+{heading}\s*\n([^\n#]+)", re.IGNORECASE | re.MULTILINE)
+    for heading in ("Summary", "Overview", "Problem")
+]
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
+_PHASE_LINE_RE = re.compile(r"^#+\s+Phase", re.IGNORECASE)
+_LIST_ITEM_RE = re.compile(r"^[-*]\s+(?:\[[ xX]\]\s+)?(.+)$", re.MULTILINE)
+_DELIVERABLE_RE = re.compile(
+    r"^[-*]\s+(?:\[(?P<status>[ xX✓])\]\s+)?(?P<item>.+)$", re.MULTILINE
+)
+_PHASE_HEADING_RE = re.compile(
+    r"^###\s+(?P<prefix>[✅🔄⏸️❌✔️\-\s]*)?"
+    r"Phase\s+(?P<identifier>[^\s:]+)"
+    r"[:\s]+(?P<title>.+)$",
+    re.MULTILINE | re.IGNORECASE,
+)
+_PHASE_STATUS_SUFFIX_RE = re.compile(
+    r"\((COMPLETE|IN PROGRESS|BLOCKED|NOT STARTED)\)", re.IGNORECASE
+)
+
+
+def _unwrap_inline_markup(match: re.Match[str]) -> str:
+    """Return the inner text of an inline markup span, cleaning nested spans."""
+    inner = match.group(1) or match.group(2) or match.group(3)
+    if "*" in inner or "`" in inner:
+        return _INLINE_MARKUP_RE.sub(_unwrap_inline_markup, inner)
+    return inner
+
 
 @dataclass
 class ParsedTask:
@@ -55,14 +95,15 @@ class MarkdownTaskParser:
         """Parse a markdown task file."""
         content = file_path.read_text(encoding="utf-8")
 
-        title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+        title_match = _TITLE_RE.search(content)
         title = title_match.group(1).strip() if title_match else file_path.stem
 
         metadata = self._extract_metadata(content)
 
-        description = self._extract_section(
-            content, ["Objective", "Description", "Goals", "Context"]
-        )
+        # The objective section doubles as the human-summary fallback, so it is
+        # extracted once and shared rather than re-scanned for the summary.
+        objective = self._extract_section(content, ["Objective", "Description"])
+        description = objective or self._extract_section(content, ["Goals", "Context"])
         objectives = self._extract_list_items(content, ["Objectives", "Goals"])
         deliverables = self._extract_deliverables(content)
         phases = self._extract_phases(content)
@@ -72,7 +113,7 @@ class MarkdownTaskParser:
         notes = self._extract_section(
             content, ["Notes", "Additional Notes", "Comments", "Summary"]
         )
-        human_summary = self._extract_human_summary(content)
+        human_summary = self._extract_human_summary(content, objective=objective)
 
         parsed = ParsedTask(
             title=title,
@@ -93,14 +134,14 @@ class MarkdownTaskParser:
     def _extract_metadata(self, content: str) -> Dict[str, Optional[str]]:
         """Extract metadata fields from content."""
         metadata: Dict[str, Optional[str]] = {}
-        metadata_block = re.sub(r"\*\*(.*?)\*\*", r"\1", content)
-        metadata_block = re.sub(r"`([^`]+)`", r"\1", metadata_block)
-        metadata_block = re.sub(r"__([^_]+)__", r"\1", metadata_block)
+        metadata_block = _BOLD_RE.sub(r"\1", content)
+        metadata_block = _CODE_RE.sub(r"\1", metadata_block)
+        metadata_block = _UNDERSCORE_BOLD_RE.sub(r"\1", metadata_block)
         for key, pattern in self.METADATA_PATTERNS.items():
             match = re.search(pattern, metadata_block, re.IGNORECASE)
             if match:
                 value = match.group(1).strip()
-                value = re.sub(r"[`*#_]", "", value)
+                value = _MARKUP_CHARS_RE.sub("", value)
                 metadata[key] = value
         return metadata
 
@@ -116,27 +157,29 @@ class MarkdownTaskParser:
                 return section_content
         return ""
 
-    def _extract_human_summary(self, content: str) -> str:
-        """Extract concise human-readable summary from task content."""
-        summary_patterns = [
-            r"##\s+Summary\s*\n([^\n#]+)",
-            r"##\s+Overview\s*\n([^\n#]+)",
-            r"##\s+Problem\s*\n([^\n#]+)",
-        ]
+    def _extract_human_summary(
+        self, content: str, objective: Optional[str] = None
+    ) -> str:
+        """Extract concise human-readable summary from task content.
 
-        for pattern in summary_patterns:
-            match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
+        ``objective`` may carry an already-extracted Objective/Description
+        section to avoid scanning the document for it again.
+        """
+        for pattern in _SUMMARY_RES:
+            match = pattern.search(content)
             if match:
                 summary = match.group(1).strip()
                 text = self._trim_to_sentences(summary, max_sentences=2)
                 if text:
                     return text
 
-        desc = self._extract_section(content, ["Objective", "Description"])
+        if objective is None:
+            objective = self._extract_section(content, ["Objective", "Description"])
+        desc = objective
         if desc:
-            clean = re.sub(r"\*\*([^*]+)\*\*", r"\1", desc)
-            clean = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", clean)
-            clean = re.sub(r"`([^`]+)`", r"\1", clean)
+            clean = _BOLD_TEXT_RE.sub(r"\1", desc)
+            clean = _LINK_RE.sub(r"\1", clean)
+            clean = _CODE_RE.sub(r"\1", clean)
             text = self._trim_to_sentences(clean, max_chars=200)
             if text:
                 return text
@@ -152,7 +195,7 @@ class MarkdownTaskParser:
     ) -> str:
         """Trim text to a limited number of sentences and characters."""
         normalized = " ".join(text.split())
-        sentences = re.split(r"(?<=[.!?])\s+", normalized)
+        sentences = _SENTENCE_BREAK_RE.split(normalized)
         selected = " ".join(sentence.strip() for sentence in sentences[:max_sentences] if sentence.strip())
         if not selected:
             selected = normalized[: max_chars or len(normalized)]
@@ -170,7 +213,7 @@ class MarkdownTaskParser:
             lines = desc.split("\n")
             clean_lines: List[str] = []
             for line in lines:
-                if re.match(r"^#+\s+Phase", line, re.IGNORECASE):
+                if _PHASE_LINE_RE.match(line):
                     break
                 if line.strip().startswith("**") and len(line) > 100:
                     continue
@@ -196,9 +239,7 @@ class MarkdownTaskParser:
         if not section_content:
             return []
 
-        items = re.findall(
-            r"^[-*]\s+(?:\[[ xX]\]\s+)?(.+)$", section_content, re.MULTILINE
-        )
+        items = _LIST_ITEM_RE.findall(section_content)
         return [self._clean_markdown(item) for item in items]
 
     def _extract_deliverables(self, content: str) -> List[Dict[str, str]]:
@@ -209,11 +250,7 @@ class MarkdownTaskParser:
         if not section_content:
             return []
 
-        items = re.findall(
-            r"^[-*]\s+(?:\[(?P<status>[ xX✓])\]\s+)?(?P<item>.+)$",
-            section_content,
-            re.MULTILINE,
-        )
+        items = _DELIVERABLE_RE.findall(section_content)
         deliverables: List[Dict[str, str]] = []
         for status, item in items:
             item_clean = self._clean_markdown(item)
@@ -232,14 +269,7 @@ class MarkdownTaskParser:
 
     def _extract_phases(self, content: str) -> List[Dict[str, Optional[str]]]:
         """Extract phase information from progress sections."""
-        phase_pattern = re.compile(
-            r"^###\s+(?P<prefix>[✅🔄⏸️❌✔️\-\s]*)?"
-            r"Phase\s+(?P<identifier>[^\s:]+)"
-            r"[:\s]+(?P<title>.+)$",
-            re.MULTILINE | re.IGNORECASE,
-        )
-
-        matches = list(phase_pattern.finditer(content))
+        matches = list(_PHASE_HEADING_RE.finditer(content))
         phases: List[Dict[str, Optional[str]]] = []
 
         for index, match in enumerate(matches):
@@ -251,12 +281,7 @@ class MarkdownTaskParser:
             heading_text = match.group(0)
             phase_id = match.group("identifier").strip()
             phase_title = match.group("title").strip()
-            phase_title = re.sub(
-                r"\((COMPLETE|IN PROGRESS|BLOCKED|NOT STARTED)\)",
-                "",
-                phase_title,
-                flags=re.IGNORECASE,
-            ).strip()
+            phase_title = _PHASE_STATUS_SUFFIX_RE.sub("", phase_title).strip()
             status = self._detect_phase_status(heading_text)
 
             phases.append(
@@ -273,11 +298,7 @@ class MarkdownTaskParser:
     @staticmethod
     def _clean_markdown(value: str) -> str:
         """Remove basic markdown formatting tokens from a string."""
-        value = value.strip()
-        value = re.sub(r"`([^`]+)`", r"\1", value)
-        value = re.sub(r"\*\*(.+?)\*\*", r"\1", value)
-        value = re.sub(r"\*(.+?)\*", r"\1", value)
-        return value.strip()
+        return _INLINE_MARKUP_RE.sub(_unwrap_inline_markup, value.strip()).strip()
 
     @staticmethod
     def _detect_phase_status(heading: str) -> str:
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from enum import Enum
-from typing import List, Optional
+from datetime import datetime, timezone
+from enum import StrEnum
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
-class TaskStatus(str, Enum):
+class TaskStatus(StrEnum):
     """High-level workflow status for tasks."""
 
     DRAFT = "draft"
@@ -22,7 +22,7 @@ class TaskStatus(str, Enum):
     ARCHIVED = "archived"
 
 
-class Priority(str, Enum):
+class Priority(StrEnum):
     """Priority levels applied to tasks."""
 
     LOW = "low"
@@ -31,10 +31,32 @@ class Priority(str, Enum):
     CRITICAL = "critical"
 
 
+# Both enums are StrEnums, so these lookups also work if a field was assigned a
+# plain string value without validation. The Task predicates look these up on
+# every call rather than caching: status is reassigned in place (see
+# TaskManager.update_status), and pydantic private attributes are slower to
+# read than the frozenset/dict lookup itself.
+_ACTIVE_STATUSES = frozenset(
+    {
+        TaskStatus.READY,
+        TaskStatus.IN_PROGRESS,
+        TaskStatus.BLOCKED,
+        TaskStatus.WAITING_FOR_HUMAN,
+        TaskStatus.UNDER_REVIEW,
+    }
+)
+_PRIORITY_RANK = {
+    Priority.CRITICAL: 0,
+    Priority.HIGH: 1,
+    Priority.MEDIUM: 2,
+    Priority.LOW: 3,
+}
+
+
 class Phase(BaseModel):
     """Discrete phase within a task roadmap."""
 
-    model_config = ConfigDict(populate_by_name=True, use_enum_values=True)
+    model_config = ConfigDict(frozen=True)
 
     id: str = Field(..., description="Phase identifier (e.g., phase-1)")
     title: str = Field(..., description="Human-readable phase title.")
@@ -53,30 +75,20 @@ class Phase(BaseModel):
 class SuccessCriterion(BaseModel):
     """Success criteria tracked per task."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True)
 
     id: str = Field(..., description="Unique identifier for the success criterion.")
     description: str = Field(..., description="Description of the success criterion.")
-    status: str = Field(
+    status: Literal["pending", "in_progress", "completed", "failed"] = Field(
         default="pending",
         description="Completion state (pending | in_progress | completed | failed).",
     )
 
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, value: str) -> str:
-        """Ensure success criterion status is one of the supported values."""
-        allowed = {"pending", "in_progress", "completed", "failed"}
-        if value not in allowed:
-            msg = f"status must be one of {sorted(allowed)}"
-            raise ValueError(msg)
-        return value
-
 
 class Prompt(BaseModel):
     """Individual prompt entry for a task."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True)
 
     timestamp: datetime = Field(
         ..., description="Timestamp for when the prompt was issued."
@@ -96,8 +108,6 @@ class Prompt(BaseModel):
 class Prompts(BaseModel):
     """Collection of prompt content for a task."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     starter: str = Field(..., description="Primary starter prompt content.")
     followups: List[Prompt] = Field(
         default_factory=list,
@@ -108,7 +118,7 @@ class Prompts(BaseModel):
 class StatusUpdate(BaseModel):
     """Chronological status update authored during task execution."""
 
-    model_config = ConfigDict(populate_by_name=True, use_enum_values=True)
+    model_config = ConfigDict(frozen=True)
 
     timestamp: datetime = Field(
         ..., description="Timestamp when the status update was recorded."
@@ -126,10 +136,10 @@ class StatusUpdate(BaseModel):
 class Deliverable(BaseModel):
     """Deliverable artifact tracked for task completion."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True)
 
     path: str = Field(..., description="Repository-relative path to the deliverable.")
-    status: str = Field(
+    status: Literal["pending", "in_progress", "completed"] = Field(
         default="pending",
         description="Completion state (pending | in_progress | completed).",
     )
@@ -137,24 +147,14 @@ class Deliverable(BaseModel):
         default=None, description="Human-readable description of the deliverable."
     )
 
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, value: str) -> str:
-        """Validate deliverable status values."""
-        allowed = {"pending", "in_progress", "completed"}
-        if value not in allowed:
-            msg = f"status must be one of {sorted(allowed)}"
-            raise ValueError(msg)
-        return value
-
 
 class Dependency(BaseModel):
     """Relationship metadata between tasks."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True)
 
     task_id: str = Field(..., description="Referenced task identifier.")
-    type: str = Field(
+    type: Literal["depends_on", "blocks", "related"] = Field(
         default="depends_on",
         description="Relationship type (depends_on | blocks | related).",
     )
@@ -165,21 +165,11 @@ class Dependency(BaseModel):
         default=None, description="Additional notes about the dependency."
     )
 
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, value: str) -> str:
-        """Ensure dependency type is supported."""
-        allowed = {"depends_on", "blocks", "related"}
-        if value not in allowed:
-            msg = f"type must be one of {sorted(allowed)}"
-            raise ValueError(msg)
-        return value
-
 
 class ExternalLink(BaseModel):
     """Reference to relevant external resources."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True)
 
     url: str = Field(..., description="External resource URL.")
     title: str = Field(..., description="Display title for the external resource.")
@@ -188,11 +178,11 @@ class ExternalLink(BaseModel):
 class Issue(BaseModel):
     """Issue tracked against the task's lifecycle."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True)
 
     id: str = Field(..., description="Issue identifier scoped to the task.")
     title: str = Field(..., description="Concise issue summary.")
-    status: str = Field(
+    status: Literal["open", "in_progress", "resolved", "wont_fix"] = Field(
         default="open",
         description="Issue status (open | in_progress | resolved | wont_fix).",
     )
@@ -200,24 +190,14 @@ class Issue(BaseModel):
         default=None, description="Resolution notes when an issue is closed."
     )
 
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, value: str) -> str:
-        """Validate issue status values."""
-        allowed = {"open", "in_progress", "resolved", "wont_fix"}
-        if value not in allowed:
-            msg = f"status must be one of {sorted(allowed)}"
-            raise ValueError(msg)
-        return value
-
 
 class Branch(BaseModel):
     """Branch lifecycle metadata."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True)
 
     name: str = Field(..., description="Git branch name associated with the task.")
-    status: str = Field(
+    status: Literal["active", "merged", "abandoned"] = Field(
         default="active",
         description="Branch status (active | merged | abandoned).",
     )
@@ -225,22 +205,10 @@ class Branch(BaseModel):
         default=None, description="When the branch was merged, if applicable."
     )
 
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, value: str) -> str:
-        """Validate branch status values."""
-        allowed = {"active", "merged", "abandoned"}
-        if value not in allowed:
-            msg = f"status must be one of {sorted(allowed)}"
-            raise ValueError(msg)
-        return value
-
 
 class Task(BaseModel):
     """Primary task representation tracked by AgentJobs."""
 
-    model_config = ConfigDict(populate_by_name=True, use_enum_values=True)
-
     # Core metadata
     id: str = Field(..., description="Unique task identifier (e.g., task-001).")
     title: str = Field(..., description="Task title summarising the work.")
@@ -322,30 +290,44 @@ class Task(BaseModel):
 
     def is_active(self) -> bool:
         """Return True for statuses representing in-progress work."""
-        return self.status in {
-            TaskStatus.READY,
-            TaskStatus.IN_PROGRESS,
-            TaskStatus.BLOCKED,
-            TaskStatus.WAITING_FOR_HUMAN,
-            TaskStatus.UNDER_REVIEW,
-        }
+        return self.status in _ACTIVE_STATUSES
 
     def priority_rank(self) -> int:
         """Provide numeric ordering for priority comparisons."""
-        order = {
-            Priority.CRITICAL: 0,
-            Priority.HIGH: 1,
-            Priority.MEDIUM: 2,
-            Priority.LOW: 3,
-        }
-        return order[self.priority]
+        return _PRIORITY_RANK[self.priority]
+
+
+# Top-level Task field names, for webhooks that only want part of the task.
+# Keep in step with the Task fields above.
+TaskField = Literal[
+    "id",
+    "title",
+    "created",
+    "updated",
+    "status",
+    "priority",
+    "category",
+    "assigned_to",
+    "estimated_effort",
+    "human_summary",
+    "description",
+    "phases",
+    "success_criteria",
+    "prompts",
+    "status_updates",
+    "comments",
+    "deliverables",
+    "dependencies",
+    "external_links",
+    "issues",
+    "tags",
+    "branches",
+]
 
 
 class Comment(BaseModel):
     """Comment on a task for human-agent communication."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     id: str = Field(..., description="Unique comment identifier.")
     task_id: str = Field(..., description="Task this comment belongs to.")
     author: str = Field(..., description="Author of the comment (human or agent).")
@@ -371,8 +353,6 @@ class Comment(BaseModel):
 class Webhook(BaseModel):
     """Webhook configuration for task event notifications."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     id: str = Field(..., description="Unique webhook identifier.")
     url: HttpUrl = Field(..., description="Target URL for webhook delivery.")
     events: List[str] = Field(
@@ -380,6 +360,10 @@ class Webhook(BaseModel):
     )
     secret: str = Field(..., description="Secret for HMAC signature verification.")
     active: bool = Field(default=True, description="Whether this webhook is active.")
+    fields: Optional[List[TaskField]] = Field(
+        default=None,
+        description="Task fields to include in payloads; the whole task when unset.",
+    )
     created: datetime = Field(..., description="When the webhook was created.")
     last_triggered: Optional[datetime] = Field(
         default=None, description="Last time this webhook was successfully triggered."
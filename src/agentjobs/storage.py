@@ -2,27 +2,73 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import re
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import yaml
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from .models import Comment, Task, Webhook
+from .models import Task, Webhook
+from .utils.yaml_safe import SafeDumper, SafeLoader
 
 logger = logging.getLogger(__name__)
 
+INDEX_FILENAME = ".agentjobs-index.json"
+_INDEX_VERSION = 2
+_TERM_RE = re.compile(r"\w+")
+_TASK_NUMBER_RE = re.compile(r"task-(\d+)\.yaml")
+
+# Re-reading only a handful of changed files is cheaper without a thread pool.
+_PARALLEL_READ_THRESHOLD = 16
+_MAX_READ_WORKERS = 32
+
+# Built once so every load reuses the same compiled pydantic-core validators.
+_TASK_ADAPTER: TypeAdapter[Task] = TypeAdapter(Task)
+_TASK_LIST_ADAPTER: TypeAdapter[List[Task]] = TypeAdapter(List[Task])
+_WEBHOOK_ADAPTER: TypeAdapter[Webhook] = TypeAdapter(Webhook)
+
+
+class TaskSaveError(RuntimeError):
+    """Raised when a task in a bulk save cannot be written.
+
+    ``task_id`` names the task that failed and ``written`` lists the ids that
+    were already replaced on disk; every other task in the batch was left as is.
+    """
+
+    def __init__(self, task_id: str, written: List[str], cause: BaseException):
+        super().__init__(f"Failed to save task {task_id}: {cause}")
+        self.task_id = task_id
+        self.written = written
+
 
 class TaskStorage:
-    """YAML-based task storage."""
+    """YAML-based task storage.
+
+    Parsed task data is cached in an index file inside ``tasks_dir``. Entries
+    are keyed by each YAML file's size and mtime, so edits made outside
+    AgentJobs are picked up on the next listing and the YAML files remain the
+    source of truth.
+    """
 
     def __init__(self, tasks_dir: Path):
         """Initialize storage with tasks directory."""
         self.tasks_dir = Path(tasks_dir)
         self.tasks_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.tasks_dir / INDEX_FILENAME
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._terms: Dict[str, List[str]] = {}
+        self._blobs: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        self._own_writes: Set[str] = set()
+        self._index_mtime_ns = 0
+        self._index_lock = threading.RLock()
 
     def _task_path(self, task_id: str) -> Path:
         """Resolve the path for a given task identifier."""
@@ -33,14 +79,25 @@ class TaskStorage:
         return self.tasks_dir / filename
 
     def load_task(self, task_id: str) -> Optional[Task]:
-        """Load task from YAML file."""
+        """Load task from YAML file, reusing its index entry if the file is unchanged."""
         path = self._task_path(task_id)
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             return None
+        with self._index_lock:
+            entry = self._index.get(path.stem) if self._index is not None else None
+            if entry is not None and not self._entry_matches(path.stem, entry, stat):
+                entry = None
+        if entry is not None:
+            return self._task_from_entry(path.stem, entry)
+        return self._read_task(path)
 
+    def _read_task(self, path: Path) -> Optional[Task]:
+        """Parse and validate a task YAML file, logging and skipping bad files."""
         try:
             content = path.read_text(encoding="utf-8")
-            data = yaml.safe_load(content) or {}
+            data = yaml.load(content, Loader=SafeLoader) or {}
         except yaml.YAMLError as exc:  # pragma: no cover - defensive logging path
             logger.error("Failed to parse YAML for %s: %s", path, exc)
             return None
@@ -50,41 +107,269 @@ class TaskStorage:
             return None
 
         try:
-            return Task.model_validate(data)
+            return _TASK_ADAPTER.validate_python(data)
         except ValidationError as exc:  # pragma: no cover - defensive logging path
             logger.error("Validation error loading %s: %s", path, exc)
             return None
 
     def save_task(self, task: Task) -> Task:
         """Save task to YAML file, returning the persisted Task instance."""
+        path = self._task_path(task.id)
+        tmp_path, task_dict = self._stage_task(task, path, datetime.now(tz=timezone.utc))
+        os.replace(tmp_path, path)
+        self._remember_write(path, task_dict)
+        return task
+
+    def save_tasks_bulk(self, tasks: Iterable[Task]) -> List[Task]:
+        """Save several tasks, stamping them all with one ``updated`` time.
+
+        Every file is staged before any is replaced, so a task that fails to
+        serialize leaves the directory untouched, and the directory is synced
+        once for the whole batch. A task that cannot be staged or replaced
+        raises ``TaskSaveError`` naming it and the tasks already written.
+        """
         now = datetime.now(tz=timezone.utc)
-        task.updated = now
+        saved: List[Task] = []
+        staged: Dict[Path, Tuple[Path, Dict[str, Any]]] = {}
+        try:
+            for task in tasks:
+                path = self._task_path(task.id)
+                try:
+                    staged[path] = self._stage_task(task, path, now)
+                except Exception as exc:
+                    raise TaskSaveError(task.id, [], exc) from exc
+                saved.append(task)
+        except BaseException:
+            for tmp_path, _ in staged.values():
+                tmp_path.unlink(missing_ok=True)
+            raise
+        written: List[str] = []
+        pending = list(staged.items())
+        try:
+            for path, (tmp_path, task_dict) in pending:
+                try:
+                    os.replace(tmp_path, path)
+                except OSError as exc:
+                    for _, (leftover, _) in pending[len(written):]:
+                        leftover.unlink(missing_ok=True)
+                    raise TaskSaveError(task_dict["id"], written, exc) from exc
+                self._remember_write(path, task_dict)
+                written.append(task_dict["id"])
+        finally:
+            if written:
+                _fsync_directory(self.tasks_dir)
+        return saved
 
-        path = self._task_path(task.id)
+    def _stage_task(
+        self, task: Task, path: Path, now: datetime
+    ) -> Tuple[Path, Dict[str, Any]]:
+        """Stamp ``task`` with ``now`` and write it beside ``path`` for an atomic swap.
+
+        Returns the temporary file (not matched by the ``*.yaml`` glob) and the
+        dumped task data.
+        """
+        task.updated = now
         task_dict = task.model_dump(mode="json", exclude_none=True)
-        yaml_text = yaml.safe_dump(task_dict, sort_keys=False, allow_unicode=False)
-        path.write_text(yaml_text, encoding="utf-8")
-        return task
+        yaml_bytes = yaml.dump(
+            task_dict,
+            Dumper=SafeDumper,
+            sort_keys=False,
+            allow_unicode=False,
+            encoding="utf-8",
+        )
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            tmp_path.write_bytes(yaml_bytes)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return tmp_path, task_dict
+
+    def _remember_write(self, path: Path, task_dict: Dict[str, Any]) -> None:
+        """Seed a loaded index with a just-written task so listing skips re-reading it."""
+        with self._index_lock:
+            if self._index is None:
+                return
+            try:
+                stat = path.stat()
+            except OSError:  # pragma: no cover - removed right after writing
+                return
+            self._index[path.stem] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "task": task_dict,
+            }
+            self._own_writes.add(path.stem)
 
     def list_tasks(self) -> List[Task]:
-        """List all tasks."""
-        tasks: List[Task] = []
+        """List all tasks, reusing indexed data for files unchanged on disk."""
+        entries, loaded = self._refresh_index()
+        return self._tasks_from_entries(list(entries.items()), loaded)
+
+    def rebuild_index(self) -> None:
+        """Discard the task index and rebuild it from the YAML files on disk."""
+        with self._index_lock:
+            self.index_path.unlink(missing_ok=True)
+            self._index = None
+            self._index_mtime_ns = 0
+            self._refresh_index_locked()
+
+    def _refresh_index(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Task]]:
+        """Reconcile the index with the YAML files on disk.
+
+        Returns the index entries in file order together with the tasks that had
+        to be re-read from YAML (and so are already validated).
+        """
+        with self._index_lock:
+            return self._refresh_index_locked()
+
+    def _refresh_index_locked(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Task]]:
+        """Body of ``_refresh_index``; callers must hold ``_index_lock``."""
+        entries = self._load_index()
+        current: Dict[str, Optional[Dict[str, Any]]] = {}
+        stale: List[Tuple[Path, os.stat_result]] = []
         for path in sorted(self.tasks_dir.glob("*.yaml")):
-            task = self.load_task(path.stem)
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # pragma: no cover - deleted mid-listing
+                continue
+            entry = entries.get(path.stem)
+            if entry is not None and self._entry_matches(path.stem, entry, stat):
+                current[path.stem] = entry
+            else:
+                current[path.stem] = None
+                stale.append((path, stat))
+
+        loaded: Dict[str, Task] = {}
+        for (path, stat), task in zip(stale, self._read_tasks([path for path, _ in stale])):
+            if task is None:
+                continue
+            current[path.stem] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "task": task.model_dump(mode="json", exclude_none=True),
+            }
+            loaded[path.stem] = task
+
+        fresh = {stem: entry for stem, entry in current.items() if entry is not None}
+        if stale or self._own_writes or fresh.keys() != entries.keys():
+            self._save_index(fresh)
+        return fresh, loaded
+
+    def _entry_matches(self, stem: str, entry: Dict[str, Any], stat: os.stat_result) -> bool:
+        """Whether an index entry still describes the file with ``stat``.
+
+        Callers must hold ``_index_lock``. Files modified no earlier than the
+        index itself never match, as the filesystem's mtime granularity may hide
+        a same-size rewrite; entries seeded by save_task in this process already
+        match their file.
+        """
+        return (
+            entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+            and (stat.st_mtime_ns < self._index_mtime_ns or stem in self._own_writes)
+            and isinstance(entry.get("task"), dict)
+        )
+
+    def _read_tasks(self, paths: List[Path]) -> List[Optional[Task]]:
+        """Read several task files, parsing in a thread pool for larger batches."""
+        if len(paths) <= _PARALLEL_READ_THRESHOLD:
+            return [self._read_task(path) for path in paths]
+        workers = min(_MAX_READ_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._read_task, paths))
+
+    def _tasks_from_entries(
+        self,
+        items: List[Tuple[str, Dict[str, Any]]],
+        loaded: Dict[str, Task],
+    ) -> List[Task]:
+        """Build tasks for index entries, validating the indexed ones in one call."""
+        pending = [(stem, entry) for stem, entry in items if stem not in loaded]
+        try:
+            validated = _TASK_LIST_ADAPTER.validate_python(
+                [entry["task"] for _, entry in pending]
+            )
+        except ValidationError:
+            # Rare (an index written by an older schema): redo item by item so
+            # only the failing entries fall back to their YAML files.
+            validated = [self._task_from_entry(stem, entry) for stem, entry in pending]
+        built = dict(zip((stem for stem, _ in pending), validated))
+        tasks: List[Task] = []
+        for stem, _ in items:
+            task = loaded.get(stem) or built.get(stem)
             if task is not None:
                 tasks.append(task)
         return tasks
 
+    def _task_from_entry(self, stem: str, entry: Dict[str, Any]) -> Optional[Task]:
+        """Validate indexed task data, falling back to the YAML file if it is stale."""
+        try:
+            return _TASK_ADAPTER.validate_python(entry["task"])
+        except ValidationError:
+            return self._read_task(self._task_path(stem))
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Return index entries, re-reading the index file only when it changed."""
+        try:
+            mtime_ns = self.index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._index = {}
+            self._terms = {}
+            self._index_mtime_ns = 0
+            return self._index
+        if self._index is not None and mtime_ns == self._index_mtime_ns:
+            return self._index
+        self._own_writes.clear()
+
+        entries: Any = None
+        terms: Any = None
+        try:
+            payload = json.loads(self.index_path.read_bytes())
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable task index %s: %s", self.index_path, exc)
+        else:
+            if isinstance(payload, dict) and payload.get("version") == _INDEX_VERSION:
+                entries = payload.get("tasks")
+                terms = payload.get("terms")
+        if isinstance(entries, dict) and isinstance(terms, dict):
+            self._index = entries
+            self._terms = terms
+        else:
+            self._index = {}
+            self._terms = {}
+        self._index_mtime_ns = mtime_ns
+        return self._index
+
+    def _save_index(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Persist index entries and their search terms, tolerating read-only dirs."""
+        terms = _build_terms(entries)
+        payload = {"version": _INDEX_VERSION, "tasks": entries, "terms": terms}
+        tmp_path = self.index_path.with_name(f"{INDEX_FILENAME}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+            self._index_mtime_ns = self.index_path.stat().st_mtime_ns
+        except OSError as exc:  # pragma: no cover - read-only or racing filesystem
+            logger.warning("Could not write task index %s: %s", self.index_path, exc)
+            self._index_mtime_ns = 0
+        self._index = entries
+        self._terms = terms
+        self._own_writes.clear()
+        self._blobs = {
+            stem: cached for stem, cached in self._blobs.items() if stem in entries
+        }
+
     def generate_task_id(self) -> str:
         """Generate the next task identifier in sequence."""
         highest = 0
-        for path in self.tasks_dir.glob("task-*.yaml"):
-            stem = path.stem
-            try:
-                number = int(stem.split("-", maxsplit=1)[1])
-            except (IndexError, ValueError):
-                continue
-            highest = max(highest, number)
+        with os.scandir(self.tasks_dir) as entries:
+            for entry in entries:
+                match = _TASK_NUMBER_RE.fullmatch(entry.name)
+                if match is not None:
+                    number = int(match.group(1))
+                    if number > highest:
+                        highest = number
         return f"task-{highest + 1:03d}"
 
     def delete_task(self, task_id: str) -> bool:
@@ -96,52 +381,282 @@ class TaskStorage:
         return True
 
     def search_tasks(self, query: str) -> List[Task]:
-        """Full-text search across tasks."""
+        """Full-text search across tasks.
+
+        Matching is a case-insensitive substring test. The index's term postings
+        narrow the tasks that need checking, so only plausible matches are
+        validated into Task objects.
+        """
         normalized = query.lower()
-        results: List[Task] = []
-        for task in self.list_tasks():
-            haystacks = [
-                task.title,
-                task.human_summary,
-                task.description,
-                " ".join(task.tags),
-            ]
-            if any(normalized in (haystack or "").lower() for haystack in haystacks):
-                results.append(task)
-        return results
+        entries, loaded = self._refresh_index()
+        candidates = _search_candidates(normalized, self._terms)
+        matches = [
+            (stem, entry)
+            for stem, entry in entries.items()
+            if (candidates is None or stem in candidates)
+            and normalized in self._search_blob(stem, entry)
+        ]
+        return self._tasks_from_entries(matches, loaded)
+
+    def _search_blob(self, stem: str, entry: Dict[str, Any]) -> str:
+        """Return the entry's search text, memoized until the entry is replaced."""
+        cached = self._blobs.get(stem)
+        if cached is not None and cached[0] is entry:
+            return cached[1]
+        blob = _search_blob(entry["task"])
+        self._blobs[stem] = (entry, blob)
+        return blob
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush directory entries (renames) to disk where the platform allows it."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # pragma: no cover - e.g. Windows cannot open directories
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover - filesystem without directory fsync
+        pass
+    finally:
+        os.close(fd)
+
+
+def _search_blob(data: Dict[str, Any]) -> str:
+    """Return the lowercase text covered by full-text search, one field per line."""
+    return "\n".join(
+        (
+            data.get("title") or "",
+            data.get("human_summary") or "",
+            data.get("description") or "",
+            " ".join(data.get("tags") or []),
+        )
+    ).lower()
+
+
+def _build_terms(entries: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Build term postings (word -> task stems) for the indexed tasks."""
+    postings: Dict[str, Set[str]] = {}
+    for stem, entry in entries.items():
+        for term in _TERM_RE.findall(_search_blob(entry["task"])):
+            postings.setdefault(term, set()).add(stem)
+    return {term: sorted(stems) for term, stems in postings.items()}
+
+
+def _search_candidates(
+    normalized: str, terms: Dict[str, List[str]]
+) -> Optional[Set[str]]:
+    """Return the task stems that could contain ``normalized`` as a substring.
+
+    Any substring match must contain each inner query word as a whole indexed
+    term; the first and last words may be the tail or head of a longer term.
+    Returns None when the query has no words to narrow on.
+    """
+    words = _TERM_RE.findall(normalized)
+    if not words:
+        return None
+
+    candidates: Optional[Set[str]] = None
+    last = len(words) - 1
+    for position, word in enumerate(words):
+        if last == 0:
+            matched = [term for term in terms if word in term]
+        elif position == 0:
+            matched = [term for term in terms if term.endswith(word)]
+        elif position == last:
+            matched = [term for term in terms if term.startswith(word)]
+        else:
+            matched = [word] if word in terms else []
+        stems = {stem for term in matched for stem in terms[term]}
+        candidates = stems if candidates is None else candidates & stems
+        if not candidates:
+            break
+    return candidates
 
 
 class WebhookStorage:
-    """YAML-based webhook storage."""
+    """Append-only JSON-lines webhook storage.
+
+    Saving a webhook appends its full record and deleting one appends a
+    tombstone, so neither rewrites the file; readers fold the log with the last
+    line per id winning. Writes compact the log once superseded lines pile up,
+    so reads never rewrite it. A file still holding the older YAML list is read as-is and converted to
+    JSON lines on the next write.
+
+    The folded records are cached in memory against the file's size and mtime,
+    so repeated reads only touch disk for a ``stat`` until another process
+    changes the file. ``revision()`` exposes a counter that moves whenever the
+    webhook configuration may have changed, for callers that derive their own
+    caches from it; ``last_triggered`` stamps written here do not move it.
+    """
+
+    COMPACT_THRESHOLD = 64
+    _TOMBSTONE_KEY = "deleted"
 
     def __init__(self, webhooks_path: Path):
-        """Initialize webhook storage with path to webhooks.yaml file."""
+        """Initialize webhook storage with path to the webhooks log file."""
         self.webhooks_path = Path(webhooks_path)
         self.webhooks_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._cache: Optional[Dict[str, dict]] = None
+        self._cache_superseded = 0
+        self._cache_legacy = False
+        self._cache_stat: Optional[Tuple[int, int]] = None
+        self._revision = 0
         if not self.webhooks_path.exists():
             self._write_webhooks([])
 
-    def _read_webhooks(self) -> List[dict]:
-        """Read webhooks from YAML file."""
+    def _is_legacy_yaml(self, content: str) -> bool:
+        """Return True when content is the pre-JSON-lines YAML list format."""
+        return content.lstrip()[:1] in ("-", "[")
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        """Return the log file's (mtime_ns, size), or None when it is missing."""
+        try:
+            stat = self.webhooks_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _records(self) -> Dict[str, dict]:
+        """Return live records keyed by id, refolding the log only when it changed.
+
+        Callers must hold ``_lock``.
+        """
+        stat = self._stat()
+        if self._cache is None or stat != self._cache_stat:
+            records, superseded, legacy = self._fold_log()
+            self._cache = records
+            self._cache_superseded = superseded
+            self._cache_legacy = legacy
+            self._cache_stat = stat
+            self._revision += 1
+        return self._cache
+
+    def _fold_log(self) -> Tuple[Dict[str, dict], int, bool]:
+        """Fold the log into live records keyed by id.
+
+        Returns the records, the number of superseded log lines, and whether the
+        file still uses the legacy YAML format.
+        """
         try:
             content = self.webhooks_path.read_text(encoding="utf-8")
-            data = yaml.safe_load(content) or []
-        except yaml.YAMLError as exc:  # pragma: no cover
-            logger.error("Failed to parse webhooks YAML: %s", exc)
-            return []
-        return data if isinstance(data, list) else []
+        except FileNotFoundError:
+            return {}, 0, False
+
+        if self._is_legacy_yaml(content):
+            try:
+                data = yaml.load(content, Loader=SafeLoader) or []
+            except yaml.YAMLError as exc:  # pragma: no cover
+                logger.error("Failed to parse webhooks YAML: %s", exc)
+                return {}, 0, False
+            items = data if isinstance(data, list) else []
+            records = {
+                item["id"]: item
+                for item in items
+                if isinstance(item, dict) and "id" in item
+            }
+            return records, 0, True
+
+        records: Dict[str, dict] = {}
+        line_count = 0
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            line_count += 1
+            try:
+                data = json.loads(line)
+            except ValueError:  # pragma: no cover - torn or hand-edited line
+                logger.error("Skipping malformed webhook record in %s", self.webhooks_path)
+                continue
+            if not isinstance(data, dict) or "id" not in data:
+                continue
+            # Re-inserting moves an updated webhook to the end, matching the
+            # order a full rewrite would produce.
+            records.pop(data["id"], None)
+            if not data.get(self._TOMBSTONE_KEY):
+                records[data["id"]] = data
+        return records, line_count - len(records), False
+
+    def _read_webhooks(self) -> List[dict]:
+        """Read live webhook records."""
+        with self._lock:
+            return list(self._records().values())
 
     def _write_webhooks(self, webhooks: List[dict]) -> None:
-        """Write webhooks to YAML file."""
-        yaml_text = yaml.safe_dump(webhooks, sort_keys=False, allow_unicode=False)
-        self.webhooks_path.write_text(yaml_text, encoding="utf-8")
+        """Rewrite the whole log with one line per webhook.
+
+        The revision is left alone; callers that change the records bump it.
+        """
+        with self._lock:
+            lines = "".join(
+                json.dumps(webhook, separators=(",", ":")) + "\n" for webhook in webhooks
+            )
+            tmp_path = self.webhooks_path.with_name(f"{self.webhooks_path.name}.tmp")
+            tmp_path.write_text(lines, encoding="utf-8")
+            os.replace(tmp_path, self.webhooks_path)
+            self._cache = {webhook["id"]: webhook for webhook in webhooks}
+            self._cache_superseded = 0
+            self._cache_legacy = False
+            self._cache_stat = self._stat()
+
+    def _append_records(self, new_records: List[dict], stamps_only: bool = False) -> None:
+        """Append records in a single write, converting a legacy YAML file first.
+
+        ``stamps_only`` marks records that change nothing but ``last_triggered``;
+        appending them in place leaves the revision where it was.
+        """
+        if not new_records:
+            return
+        with self._lock:
+            records = self._records()
+            before = self._cache_stat
+            if self._cache_legacy:
+                for record in new_records:
+                    records.pop(record["id"], None)
+                    if not record.get(self._TOMBSTONE_KEY):
+                        records[record["id"]] = record
+                self._write_webhooks(list(records.values()))
+                if not stamps_only:
+                    self._revision += 1
+                return
+
+            data = "".join(
+                json.dumps(record, separators=(",", ":")) + "\n" for record in new_records
+            ).encode("utf-8")
+            with self.webhooks_path.open("ab") as handle:
+                handle.write(data)
+
+            after = self._stat()
+            if before is None or after is None or after[1] != before[1] + len(data):
+                # Another writer touched the file too; refold on the next read.
+                self._cache = None
+                return
+            for record in new_records:
+                tombstone = bool(record.get(self._TOMBSTONE_KEY))
+                replaced = records.pop(record["id"], None) is not None
+                if not tombstone:
+                    records[record["id"]] = record
+                # A replaced record's old line is now dead, and so is any tombstone.
+                self._cache_superseded += int(replaced) + int(tombstone)
+            self._cache_stat = after
+            if not stamps_only:
+                self._revision += 1
+            if self._cache_superseded >= self.COMPACT_THRESHOLD:
+                self._write_webhooks(list(records.values()))
+
+    def revision(self) -> int:
+        """Return a counter that changes whenever the webhook configuration may have changed."""
+        with self._lock:
+            self._records()
+            return self._revision
 
     def list_webhooks(self) -> List[Webhook]:
         """List all webhooks."""
         webhooks: List[Webhook] = []
         for data in self._read_webhooks():
             try:
-                webhook = Webhook.model_validate(data)
+                webhook = _WEBHOOK_ADAPTER.validate_python(data)
                 webhooks.append(webhook)
             except ValidationError as exc:  # pragma: no cover
                 logger.error("Validation error loading webhook: %s", exc)
@@ -149,47 +664,66 @@ class WebhookStorage:
 
     def get_webhook(self, webhook_id: str) -> Optional[Webhook]:
         """Get webhook by ID."""
-        for data in self._read_webhooks():
-            if data.get("id") == webhook_id:
-                try:
-                    return Webhook.model_validate(data)
-                except ValidationError as exc:  # pragma: no cover
-                    logger.error("Validation error loading webhook %s: %s", webhook_id, exc)
-                    return None
-        return None
+        with self._lock:
+            data = self._records().get(webhook_id)
+        if data is None:
+            return None
+        try:
+            return _WEBHOOK_ADAPTER.validate_python(data)
+        except ValidationError as exc:  # pragma: no cover
+            logger.error("Validation error loading webhook %s: %s", webhook_id, exc)
+            return None
 
     def save_webhook(self, webhook: Webhook) -> Webhook:
         """Save or update a webhook."""
-        webhooks = self._read_webhooks()
-        webhooks = [w for w in webhooks if w.get("id") != webhook.id]
-        webhooks.append(webhook.model_dump(mode="json"))
-        self._write_webhooks(webhooks)
+        self._append_records([webhook.model_dump(mode="json")])
         return webhook
 
+    def record_triggers(self, triggered: Dict[str, datetime]) -> None:
+        """Stamp ``last_triggered`` on several webhooks with one append.
+
+        Only the timestamp is applied, onto each webhook's current record, so a
+        webhook edited or deleted while its delivery was in flight is neither
+        reverted nor resurrected.
+        """
+        with self._lock:
+            records = self._records()
+            updates = [
+                {**records[webhook_id], "last_triggered": when.isoformat()}
+                for webhook_id, when in triggered.items()
+                if webhook_id in records
+            ]
+            self._append_records(updates, stamps_only=True)
+
     def create_webhook(
         self,
         url: str,
         events: List[str],
         secret: str,
         active: bool = True,
+        fields: Optional[List[str]] = None,
     ) -> Webhook:
         """Create a new webhook."""
-        webhook = Webhook(
-            id=f"wh_{uuid.uuid4().hex[:10]}",
-            url=url,
-            events=events,
-            secret=secret,
-            active=active,
-            created=datetime.now(tz=timezone.utc),
-        )
-        return self.save_webhook(webhook)
+        spec = {"url": url, "events": events, "secret": secret, "active": active, "fields": fields}
+        return self.create_webhooks([spec])[0]
+
+    def create_webhooks(self, specs: Iterable[Dict[str, Any]]) -> List[Webhook]:
+        """Create several webhooks with one append.
+
+        Each spec holds ``create_webhook``'s keyword arguments. Every spec is
+        validated before anything is written, so one bad spec stores nothing.
+        """
+        now = datetime.now(tz=timezone.utc)
+        webhooks = [
+            Webhook(id=f"wh_{uuid.uuid4().hex[:10]}", created=now, **spec) for spec in specs
+        ]
+        self._append_records([webhook.model_dump(mode="json") for webhook in webhooks])
+        return webhooks
 
     def delete_webhook(self, webhook_id: str) -> bool:
         """Delete a webhook."""
-        webhooks = self._read_webhooks()
-        original_count = len(webhooks)
-        webhooks = [w for w in webhooks if w.get("id") != webhook_id]
-        if len(webhooks) < original_count:
-            self._write_webhooks(webhooks)
-            return True
-        return False
+        with self._lock:
+            if webhook_id not in self._records():
+                return False
+            self._append_records([{"id": webhook_id, self._TOMBSTONE_KEY: True}])
+        return True
@@ -0,0 +1,12 @@
+"""Safe YAML loader and dumper classes shared across AgentJobs."""
+
+from __future__ import annotations
+
+try:  # Prefer the libyaml-backed classes when PyYAML was built with them.
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - pure-Python PyYAML build
+    from yaml import SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+__all__ = ["SafeDumper", "SafeLoader"]
@@ -8,23 +8,52 @@ import hmac
 import json
 import logging
 import threading
+import time
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any, Awaitable, Dict, List, Optional
+from functools import lru_cache
+from typing import AbstractSet, Any, Coroutine, Dict, FrozenSet, List, Optional, Tuple
 
 import httpx
 
 from .models import Task, Webhook
 from .storage import WebhookStorage
 
+try:  # orjson is optional; it emits the same bytes as the stdlib fallback below.
+    import orjson
+except ImportError:  # pragma: no cover - orjson not installed
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_PAYLOAD_ENCODER = json.JSONEncoder(separators=(",", ":"), sort_keys=True, ensure_ascii=False)
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last second a payload was stamped.
+_timestamp_prefix: Tuple[int, str] = (-1, "")
+
+_DELIVERY_TIMEOUT = 10.0
+_DELIVERY_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_DELIVERY_HEADERS = {"Content-Type": "application/json"}
+_SIGNATURE_HEADER = "X-Hub-Signature-256"
+
 
 class WebhookManager:
-    """Manage webhook lifecycle and dispatch events."""
+    """Manage webhook lifecycle and dispatch events.
+
+    Deliveries run on a dedicated event loop thread that owns one pooled
+    ``httpx.AsyncClient``, so repeat deliveries to the same receiver reuse
+    keep-alive connections. Call ``aclose()`` (or ``close()`` outside an event
+    loop) on shutdown to release them.
+    """
 
     def __init__(self, storage: WebhookStorage):
         """Initialize webhook manager with storage."""
         self.storage = storage
+        self._lock = threading.Lock()
+        self._by_event: Dict[str, List[Webhook]] = {}
+        self._indexed_revision: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._client: Optional[httpx.AsyncClient] = None
 
     def list_webhooks(self) -> List[Webhook]:
         """List all webhooks."""
@@ -36,6 +65,7 @@ class WebhookManager:
         events: List[str],
         secret: str,
         active: bool = True,
+        fields: Optional[List[str]] = None,
     ) -> Webhook:
         """Create a new webhook."""
         return self.storage.create_webhook(
@@ -43,8 +73,13 @@ class WebhookManager:
             events=events,
             secret=secret,
             active=active,
+            fields=fields,
         )
 
+    def create_webhooks(self, specs: List[Dict[str, Any]]) -> List[Webhook]:
+        """Create several webhooks with a single storage write."""
+        return self.storage.create_webhooks(specs)
+
     def delete_webhook(self, webhook_id: str) -> bool:
         """Delete a webhook."""
         return self.storage.delete_webhook(webhook_id)
@@ -61,21 +96,42 @@ class WebhookManager:
     ) -> None:
         """Fire a webhook event asynchronously for all matching webhooks."""
         metadata = metadata or {}
-        webhooks = [
-            hook
-            for hook in self.list_webhooks()
-            if hook.active and event in hook.events
-        ]
+        webhooks = self._subscribers(event)
         if not webhooks:
             return
 
-        payload = self._build_payload(event=event, task=task, metadata=metadata)
-        payload_text = json.dumps(payload, separators=(",", ":"), sort_keys=True)
-
+        # Webhooks selecting the same task fields share one serialized payload.
+        payloads: Dict[Optional[FrozenSet[str]], bytes] = {}
+        deliveries: List[Tuple[Webhook, bytes, Optional[str]]] = []
         for webhook in webhooks:
-            signature = self._compute_signature(payload_text, webhook.secret)
-            coro = self._dispatch(webhook, payload_text, signature)
-            self._schedule(coro)
+            fields = frozenset(webhook.fields) if webhook.fields is not None else None
+            payload_bytes = payloads.get(fields)
+            if payload_bytes is None:
+                payload_bytes = self._build_payload(
+                    event=event, task=task, metadata=metadata, fields=fields
+                )
+                payloads[fields] = payload_bytes
+            signature_header = self._signature_header(payload_bytes, webhook)
+            deliveries.append((webhook, payload_bytes, signature_header))
+        self._schedule(self._fan_out(deliveries))
+
+    def _subscribers(self, event: str) -> List[Webhook]:
+        """Return active webhooks subscribed to ``event``.
+
+        The event index is rebuilt only when the storage revision moves, which
+        covers webhooks created or deleted by other processes as well.
+        """
+        with self._lock:
+            revision = self.storage.revision()
+            if revision != self._indexed_revision:
+                by_event: Dict[str, List[Webhook]] = defaultdict(list)
+                for hook in self.storage.list_webhooks():
+                    if hook.active:
+                        for name in dict.fromkeys(hook.events):
+                            by_event[name].append(hook)
+                self._by_event = dict(by_event)
+                self._indexed_revision = revision
+            return list(self._by_event.get(event, ()))
 
     def test_webhook(self, webhook_id: str) -> None:
         """Send a test webhook event."""
@@ -85,72 +141,201 @@ class WebhookManager:
 
         payload = {
             "event": "webhook.test",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc_timestamp(),
             "task": {},
             "triggered_by": "system",
             "action": "test",
         }
-        payload_text = json.dumps(payload, separators=(",", ":"), sort_keys=True)
-        signature = self._compute_signature(payload_text, webhook.secret)
-        asyncio.run(self._dispatch(webhook, payload_text, signature))
+        payload_bytes = _dump_payload(payload)
+        signature_header = self._signature_header(payload_bytes, webhook)
+        coro = self._fan_out([(webhook, payload_bytes, signature_header)])
+        asyncio.run_coroutine_threadsafe(coro, self._dispatch_loop()).result()
 
-    def _schedule(self, coro: Awaitable[None]) -> None:
-        """Schedule coroutine in background thread or existing event loop."""
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            # No running loop - create thread to run it
-            threading.Thread(target=lambda: asyncio.run(coro), daemon=True).start()
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and stop the dispatch loop."""
+        loop = self._detach_loop()
+        if loop is None:
             return
-        # Running loop exists - create task
-        loop.create_task(coro)
+        closing = asyncio.run_coroutine_threadsafe(self._close_client(), loop)
+        await asyncio.wrap_future(closing)
+        loop.call_soon_threadsafe(loop.stop)
+
+    def close(self) -> None:
+        """Blocking form of ``aclose()`` for callers outside an event loop."""
+        loop = self._detach_loop()
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._close_client(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+    def _detach_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Forget the dispatch loop so the next delivery starts a fresh one."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        return loop
+
+    def _schedule(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Schedule coroutine on the dispatch loop without waiting for it."""
+        asyncio.run_coroutine_threadsafe(coro, self._dispatch_loop())
+
+    def _dispatch_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the dispatch event loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=_run_loop,
+                    args=(loop,),
+                    name="agentjobs-webhooks",
+                    daemon=True,
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client; only called on the dispatch loop."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=_DELIVERY_TIMEOUT,
+                limits=_DELIVERY_LIMITS,
+                headers=_DELIVERY_HEADERS,
+            )
+        return self._client
+
+    async def _close_client(self) -> None:
+        """Close the shared client from the dispatch loop."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _fan_out(self, deliveries: List[Tuple[Webhook, bytes, Optional[str]]]) -> None:
+        """Send each ``(webhook, payload, signature header)`` delivery concurrently.
+
+        Successful deliveries are recorded with a single storage write once the
+        whole fan-out has finished.
+        """
+        results = await asyncio.gather(
+            *(
+                self._dispatch(webhook, payload_bytes, signature_header)
+                for webhook, payload_bytes, signature_header in deliveries
+            ),
+            return_exceptions=True,
+        )
+        now = datetime.now(tz=timezone.utc)
+        triggered = {
+            webhook.id: now
+            for (webhook, _, _), delivered in zip(deliveries, results)
+            if delivered is True
+        }
+        if triggered:
+            await asyncio.to_thread(self.storage.record_triggers, triggered)
 
     async def _dispatch(
         self,
         webhook: Webhook,
-        payload_text: str,
-        signature: str,
-    ) -> None:
-        """Dispatch webhook HTTP request asynchronously."""
-        headers = {
-            "X-Hub-Signature-256": f"sha256={signature}",
-            "Content-Type": "application/json",
-        }
+        payload_bytes: bytes,
+        signature_header: Optional[str],
+    ) -> bool:
+        """Dispatch webhook HTTP request asynchronously, returning True on success."""
+        headers = {_SIGNATURE_HEADER: signature_header} if signature_header else None
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    str(webhook.url),
-                    headers=headers,
-                    content=payload_text,
-                )
-                response.raise_for_status()
+            response = await self._get_client().post(
+                str(webhook.url),
+                headers=headers,
+                content=payload_bytes,
+            )
+            response.raise_for_status()
         except Exception as exc:  # pragma: no cover - external network call
             logger.warning("Failed to deliver webhook %s: %s", webhook.id, exc)
-            return
-
-        webhook.record_trigger()
-        self.storage.save_webhook(webhook)
+            return False
+        return True
 
     def _build_payload(
         self,
         event: str,
         task: Task,
         metadata: Dict[str, Any],
-    ) -> Dict[str, Any]:
-        """Build webhook payload."""
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> bytes:
+        """Build the serialized webhook payload.
+
+        The task is serialized straight to JSON by pydantic and spliced in, rather
+        than dumped to a dict and re-encoded. ``fields`` limits the task to those
+        top-level fields.
+        """
         payload: Dict[str, Any] = {
             "event": event,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "task": task.model_dump(mode="json"),
+            "timestamp": _utc_timestamp(),
         }
         payload.update(metadata)
-        return payload
+        if "task" in payload:
+            return _dump_payload(payload)
+        task_json = task.__pydantic_serializer__.to_json(task, include=fields)
+        return _dump_payload(payload, raw={"task": task_json})
+
+    def _signature_header(self, payload: bytes, webhook: Webhook) -> Optional[str]:
+        """Return the signature header value, or None for a webhook without a secret."""
+        if not webhook.secret:
+            return None
+        return f"sha256={self._compute_signature(payload, webhook.secret)}"
 
-    def _compute_signature(self, payload: str, secret: str) -> str:
+    def _compute_signature(self, payload: bytes, secret: str) -> str:
         """Compute HMAC-SHA256 signature for webhook payload."""
-        digest = hmac.new(
-            secret.encode(),
-            payload.encode(),
-            hashlib.sha256,
-        ).hexdigest()
-        return digest
+        mac = _hmac_template(secret).copy()
+        mac.update(payload)
+        return mac.hexdigest()
+
+
+def _dump_payload(payload: Dict[str, Any], raw: Optional[Dict[str, bytes]] = None) -> bytes:
+    """Serialize a payload as compact UTF-8 JSON with sorted top-level keys.
+
+    ``raw`` maps further top-level keys to values that are already JSON bytes;
+    they are spliced in at their sorted position without being re-encoded, so
+    their own key order is kept as given (model field order for the task).
+    """
+    if not raw:
+        return _dumps(payload)
+    members = {key: _dumps(value) for key, value in payload.items()}
+    members.update(raw)
+    return b"{" + b",".join(_dumps(key) + b":" + members[key] for key in sorted(members)) + b"}"
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode one JSON value, sorting any nested object keys."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return _PAYLOAD_ENCODER.encode(value).encode("utf-8")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as ISO 8601 with microseconds.
+
+    Same format as ``datetime.now(timezone.utc).isoformat()``, but the
+    date-time prefix is only formatted once per second.
+    """
+    global _timestamp_prefix
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _timestamp_prefix
+    if seconds != cached_seconds:
+        prefix = datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _timestamp_prefix = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Run ``loop`` until ``aclose()`` stops it, then close it."""
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+@lru_cache(maxsize=256)
+def _hmac_template(secret: str) -> hmac.HMAC:
+    """Return an HMAC keyed with ``secret``; callers ``copy()`` it per payload.
+
+    Keyed by the secret itself rather than the webhook id, so rotating a
+    webhook's secret can never sign with the old key.
+    """
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import pytest
 from fastapi.testclient import TestClient
@@ -14,21 +14,22 @@ from agentjobs.models import Priority, TaskStatus
 from agentjobs.storage import TaskStorage
 
 
-@pytest.fixture()
-def api_client(tmp_path) -> Tuple[TestClient, TaskManager]:
-    """Provide a TestClient bound to a temporary storage directory."""
+@pytest.fixture(scope="module")
+def _app_client() -> Iterator[TestClient]:
+    """Enter the app (and its lifespan) once for every test in this module."""
+    reset_dependency_cache()
+    with TestClient(app) as client:
+        yield client
     reset_dependency_cache()
-    storage = TaskStorage(tmp_path)
-    manager = TaskManager(storage)
 
-    def _override_manager() -> TaskManager:
-        return manager
 
-    app.dependency_overrides[get_task_manager] = _override_manager
-    with TestClient(app) as client:
-        yield client, manager
+@pytest.fixture()
+def api_client(_app_client: TestClient, tmp_path) -> Iterator[Tuple[TestClient, TaskManager]]:
+    """Provide the shared TestClient bound to a fresh temporary storage directory."""
+    manager = TaskManager(TaskStorage(tmp_path))
+    app.dependency_overrides[get_task_manager] = lambda: manager
+    yield _app_client, manager
     app.dependency_overrides.clear()
-    reset_dependency_cache()
 
 
 def test_health_check_endpoint(api_client) -> None:
@@ -124,47 +125,6 @@ def test_get_task_not_found(api_client) -> None:
     assert response.json()["detail"] == "Task missing not found"
 
 
-def test_patch_task_updates_fields(api_client) -> None:
-    client, manager = api_client
-    task = manager.create_task(
-        title="Patch",
-        description="Initial",
-        priority=Priority.MEDIUM,
-        category="ops",
-    )
-    response = client.patch(
-        f"/api/tasks/{task.id}",
-        json={"status": "in_progress", "assigned_to": "codex"},
-    )
-    assert response.status_code == 200
-    body = response.json()
-    assert body["status"] == TaskStatus.IN_PROGRESS.value
-    assert body["assigned_to"] == "codex"
-
-
-def test_status_update_endpoint(api_client) -> None:
-    client, manager = api_client
-    task = manager.create_task(
-        title="Status",
-        description="Track",
-        priority=Priority.MEDIUM,
-        category="ops",
-    )
-    response = client.post(
-        f"/api/tasks/{task.id}/status",
-        json={
-            "status": "blocked",
-            "author": "codex",
-            "summary": "Waiting",
-            "details": "Need input",
-        },
-    )
-    assert response.status_code == 200
-    body = response.json()
-    assert body["status"] == TaskStatus.BLOCKED.value
-    assert body["status_updates"]
-
-
 def test_get_next_task(api_client) -> None:
     client, manager = api_client
     manager.create_task(
@@ -187,24 +147,6 @@ def test_get_next_task(api_client) -> None:
     assert body["id"] == critical.id
 
 
-def test_add_progress_update(api_client) -> None:
-    client, manager = api_client
-    task = manager.create_task(
-        title="Progress",
-        description="Track",
-        priority=Priority.MEDIUM,
-        category="ops",
-    )
-    response = client.post(
-        f"/api/tasks/{task.id}/progress",
-        json={"author": "codex", "summary": "Halfway", "details": "50%"},
-    )
-    assert response.status_code == 200
-    body = response.json()
-    assert len(body["status_updates"]) == 1
-    assert body["status_updates"][0]["summary"] == "Halfway"
-
-
 def test_mark_deliverable_complete(api_client) -> None:
     client, manager = api_client
     task = manager.create_task(
@@ -245,40 +187,87 @@ def test_get_next_task_none(api_client) -> None:
     assert response.json() is None
 
 
-def test_get_starter_prompt(api_client) -> None:
-    client, manager = api_client
+@pytest.fixture()
+def base_task(api_client) -> str:
+    """Create a plain task through the manager and return its id."""
+    _, manager = api_client
     task = manager.create_task(
-        title="Prompt",
+        title="Base",
         description="Starter text",
         priority=Priority.MEDIUM,
         category="ops",
     )
-    response = client.get(f"/api/tasks/{task.id}/prompts/starter")
-    assert response.status_code == 200
-    payload = response.json()
-    assert payload["starter"] == "Starter text"
+    return task.id
 
 
-def test_add_followup_prompt(api_client) -> None:
-    client, manager = api_client
-    task = manager.create_task(
-        title="Prompt",
-        description="Starter text",
-        priority=Priority.MEDIUM,
-        category="ops",
-    )
-    response = client.post(
-        f"/api/tasks/{task.id}/prompts",
-        json={
-            "author": "codex",
-            "content": "Need clarification",
-            "context": "Followup",
-        },
-    )
+def _project(actual: Any, expected: Any) -> Any:
+    """Trim ``actual`` to the keys named in ``expected`` so the two compare directly.
+
+    Each item of a list is trimmed against the first expected item, so a length
+    mismatch still shows up in the comparison.
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        return {key: _project(actual.get(key), value) for key, value in expected.items()}
+    if isinstance(expected, list) and isinstance(actual, list) and expected:
+        return [_project(item, expected[0]) for item in actual]
+    return actual
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "payload", "expected"),
+    [
+        pytest.param(
+            "PATCH",
+            "",
+            {"status": "in_progress", "assigned_to": "codex"},
+            {"status": TaskStatus.IN_PROGRESS.value, "assigned_to": "codex"},
+            id="patch-fields",
+        ),
+        pytest.param(
+            "POST",
+            "/status",
+            {"status": "blocked", "author": "codex", "summary": "Waiting", "details": "Need input"},
+            {"status": TaskStatus.BLOCKED.value, "status_updates": [{"summary": "Waiting"}]},
+            id="status-update",
+        ),
+        pytest.param(
+            "POST",
+            "/progress",
+            {"author": "codex", "summary": "Halfway", "details": "50%"},
+            {"status_updates": [{"summary": "Halfway"}]},
+            id="progress-update",
+        ),
+        pytest.param(
+            "GET",
+            "/prompts/starter",
+            None,
+            {"starter": "Starter text"},
+            id="starter-prompt",
+        ),
+        pytest.param(
+            "POST",
+            "/prompts",
+            {"author": "codex", "content": "Need clarification", "context": "Followup"},
+            {"prompts": {"followups": [{"author": "codex"}]}},
+            id="followup-prompt",
+        ),
+    ],
+)
+def test_task_endpoints(
+    api_client,
+    base_task: str,
+    method: str,
+    path: str,
+    payload: Optional[Dict[str, Any]],
+    expected: Dict[str, Any],
+) -> None:
+    """Task sub-resource endpoints apply their change and return the result."""
+    client, _ = api_client
+    response = client.request(method, f"/api/tasks/{base_task}{path}", json=payload)
     assert response.status_code == 200
     body = response.json()
-    assert len(body["prompts"]["followups"]) == 1
-    assert body["prompts"]["followups"][0]["author"] == "codex"
+    for key, value in expected.items():
+        assert _project(body[key], value) == value
 
 
 @pytest.mark.parametrize(
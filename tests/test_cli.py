@@ -4,16 +4,44 @@ from __future__ import annotations
 
 import io
 import json
+import shutil
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
-from typer.testing import CliRunner
+import typer.main
+from click.testing import CliRunner
 
 from agentjobs import TaskStatus, Priority
-from agentjobs.cli import app, _ensure_gitignore, _make_output_encoding_safe
+from agentjobs.cli import app, _build_manager, _ensure_gitignore, _make_output_encoding_safe
 
 runner = CliRunner()
+# Typer rebuilds the Click command tree on every typer.testing invoke; build it once.
+cli = typer.main.get_command(app)
+
+
+@pytest.fixture(scope="session")
+def _initialized_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Run ``agentjobs init`` once and keep the result as a template project."""
+    template = tmp_path_factory.mktemp("template")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(template)
+        result = runner.invoke(
+            cli,
+            ["init"],
+            input="Test Project\ntasks\nprompts\n9000\n",
+            catch_exceptions=False,
+        )
+    assert result.exit_code == 0
+    return template
+
+
+@pytest.fixture()
+def initialized_project(_initialized_template: Path, tmp_path: Path, monkeypatch) -> Path:
+    """Copy the initialized template into ``tmp_path`` and chdir into it."""
+    shutil.copytree(_initialized_template, tmp_path, dirs_exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 
 def test_output_encoding_survives_legacy_codepage_stream(monkeypatch) -> None:
@@ -48,7 +76,7 @@ def test_cli_init_create_list_show(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.chdir(tmp_path)
 
     result = runner.invoke(
-        app,
+        cli,
         ["init"],
         input="Test Project\ntasks\nprompts\n9000\n",
         catch_exceptions=False,
@@ -58,7 +86,7 @@ def test_cli_init_create_list_show(tmp_path: Path, monkeypatch) -> None:
     assert (tmp_path / ".agentjobs" / "config.yaml").exists()
 
     create_result = runner.invoke(
-        app,
+        cli,
         ["create"],
         input="Sample Task\nExample description\n",
         catch_exceptions=False,
@@ -71,7 +99,7 @@ def test_cli_init_create_list_show(tmp_path: Path, monkeypatch) -> None:
     task_id = task_file.stem
 
     list_result = runner.invoke(
-        app,
+        cli,
         ["list"],
         catch_exceptions=False,
     )
@@ -79,7 +107,7 @@ def test_cli_init_create_list_show(tmp_path: Path, monkeypatch) -> None:
     assert task_id in list_result.stdout
 
     show_result = runner.invoke(
-        app,
+        cli,
         ["show", task_id],
         catch_exceptions=False,
     )
@@ -89,25 +117,21 @@ def test_cli_init_create_list_show(tmp_path: Path, monkeypatch) -> None:
     assert payload["title"] == "Sample Task"
 
 
-def test_work_command_flow(tmp_path: Path, monkeypatch) -> None:
+def test_work_command_flow(initialized_project: Path) -> None:
     """Verify the interactive agent workflow (pick task -> start -> complete)."""
-    monkeypatch.chdir(tmp_path)
-    
-    # Setup: Initialize and create a task
-    runner.invoke(app, ["init"], input="Test Project\ntasks\nprompts\n9000\n")
-    runner.invoke(app, ["create"], input="Work Task\nDescription\n")
-    
-    # Manually update task status to READY so it can be picked up
-    import yaml
-    task_file = next((tmp_path / "tasks").glob("*.yaml"))
-    content = yaml.safe_load(task_file.read_text())
-    content["status"] = "ready"
-    task_file.write_text(yaml.safe_dump(content))
-    
+    tmp_path = initialized_project
+
+    # Setup: seed a READY task directly; `create` is covered end-to-end above.
+    task = _build_manager(tmp_path).create_task(
+        title="Work Task",
+        description="Description",
+        status=TaskStatus.READY,
+    )
+
     # Run work command with mocked inputs
     # Inputs: Confirm Start (y), Confirm Complete (y), Summary
     result = runner.invoke(
-        app,
+        cli,
         ["work", "--agent", "MyAgent"],
         input="y\ny\nFixed the bug\n",
         catch_exceptions=False
@@ -119,8 +143,7 @@ def test_work_command_flow(tmp_path: Path, monkeypatch) -> None:
     assert "marked COMPLETED" in result.stdout
     
     # Verify task status on disk
-    task_file = next((tmp_path / "tasks").glob("*.yaml"))
-    content = task_file.read_text()
+    content = (tmp_path / "tasks" / f"{task.id}.yaml").read_text()
     assert "status: completed" in content
     assert "Fixed the bug" in content
 
@@ -129,7 +152,7 @@ def test_serve_command_args(monkeypatch) -> None:
     """Ensure the serve command correctly parses arguments and calls uvicorn.run."""
     with patch("uvicorn.run") as mock_run:
         result = runner.invoke(
-            app,
+            cli,
             ["serve", "--host", "0.0.0.0", "--port", "9000", "--reload"],
             catch_exceptions=False
         )
@@ -145,47 +168,47 @@ def test_serve_command_args(monkeypatch) -> None:
         )
 
 
-def test_list_tasks_filtering(tmp_path: Path, monkeypatch) -> None:
-    """Verify that list correctly filters tasks by status and priority."""
-    monkeypatch.chdir(tmp_path)
-    
-    # Setup: Initialize
-    runner.invoke(app, ["init"], input="Test Project\ntasks\nprompts\n9000\n")
-    
-    # Create PLANNED/HIGH task
-    runner.invoke(
-        app, 
-        ["create", "--priority", "high", "--title", "High Task"], 
-        input="\n" # default description
+@pytest.fixture(scope="module")
+def filtering_project(
+    _initialized_template: Path, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """An initialized project holding a DRAFT/HIGH and a COMPLETED/LOW task."""
+    project = tmp_path_factory.mktemp("filtering")
+    shutil.copytree(_initialized_template, project, dirs_exist_ok=True)
+    manager = _build_manager(project)
+    manager.create_task(title="High Task", description="", priority=Priority.HIGH)
+    manager.create_task(
+        title="Low Task",
+        description="",
+        priority=Priority.LOW,
+        status=TaskStatus.COMPLETED,
     )
-    
-    # Create COMPLETED/LOW task (create as draft/medium default, then update manually to simulate state)
-    runner.invoke(
-        app, 
-        ["create", "--priority", "low", "--title", "Low Task"], 
-        input="\n"
-    )
-    
-    # Find the Low Task file and update it
-    import yaml
-    for task_file in (tmp_path / "tasks").glob("*.yaml"):
-        content = yaml.safe_load(task_file.read_text())
-        if content["title"] == "Low Task":
-            content["status"] = "completed"
-            task_file.write_text(yaml.safe_dump(content))
-            break
-            
-    # Test Filter by Status
-    result_status = runner.invoke(app, ["list", "--status", "completed"])
-    assert result_status.exit_code == 0
-    assert "Low Task" in result_status.stdout
-    assert "High Task" not in result_status.stdout
-    
-    # Test Filter by Priority
-    result_priority = runner.invoke(app, ["list", "--priority", "high"])
-    assert result_priority.exit_code == 0
-    assert "High Task" in result_priority.stdout
-    assert "Low Task" not in result_priority.stdout
+    return project
+
+
+@pytest.mark.parametrize(
+    ("option", "value", "expected", "excluded"),
+    [
+        ("--status", "completed", "Low Task", "High Task"),
+        ("--priority", "high", "High Task", "Low Task"),
+    ],
+    ids=["status", "priority"],
+)
+def test_list_tasks_filtering(
+    filtering_project: Path,
+    monkeypatch,
+    option: str,
+    value: str,
+    expected: str,
+    excluded: str,
+) -> None:
+    """Verify that list correctly filters tasks by status and priority."""
+    monkeypatch.chdir(filtering_project)
+
+    result = runner.invoke(cli, ["list", option, value])
+    assert result.exit_code == 0
+    assert expected in result.stdout
+    assert excluded not in result.stdout
 
 
 def test_ensure_gitignore_updates(tmp_path: Path) -> None:
@@ -197,11 +220,13 @@ def test_ensure_gitignore_updates(tmp_path: Path) -> None:
     
     content = gitignore.read_text()
     assert ".agentjobs/agentjobs.db" in content
+    assert ".agentjobs-index.json" in content
     
     # Run again to ensure no duplication
     _ensure_gitignore(tmp_path)
     content = gitignore.read_text()
     assert content.count(".agentjobs/agentjobs.db") == 1
+    assert content.count(".agentjobs-index.json") == 1
 
 
 def test_migrate_command_execution(tmp_path: Path, monkeypatch) -> None:
@@ -226,7 +251,7 @@ This is a legacy task description.
     
     # Run migrate command
     result = runner.invoke(
-        app,
+        cli,
         ["migrate", str(source_dir / "*.md"), str(target_dir)],
         catch_exceptions=False
     )
@@ -251,7 +276,7 @@ def test_load_test_data(tmp_path: Path, monkeypatch) -> None:
     
     # Run load_test_data command
     result = runner.invoke(
-        app,
+        cli,
         ["load-test-data", "--storage-dir", "tasks"],
         catch_exceptions=False
     )
@@ -266,7 +291,7 @@ def test_load_test_data(tmp_path: Path, monkeypatch) -> None:
     
     # Run again to verify update/refresh logic
     result_refresh = runner.invoke(
-        app,
+        cli,
         ["load-test-data", "--storage-dir", "tasks"],
         catch_exceptions=False
     )
@@ -274,14 +299,9 @@ def test_load_test_data(tmp_path: Path, monkeypatch) -> None:
     assert "refreshed" in result_refresh.stdout
 
 
-def test_show_task_not_found(tmp_path: Path, monkeypatch) -> None:
+def test_show_task_not_found(initialized_project: Path) -> None:
     """Verify error handling when showing a non-existent task."""
-    monkeypatch.chdir(tmp_path)
-    
-    # Initialize to ensure manager can run
-    runner.invoke(app, ["init"], input="Test Project\ntasks\nprompts\n9000\n")
-    
-    result = runner.invoke(app, ["show", "non-existent-id"])
+    result = runner.invoke(cli, ["show", "non-existent-id"])
     assert result.exit_code == 1
     assert "Task 'non-existent-id' not found" in result.stdout
 
@@ -291,6 +311,6 @@ def test_load_config_fallback(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.chdir(tmp_path)
     
     # Don't run init. Just try to list tasks (which loads config).
-    result = runner.invoke(app, ["list"])
+    result = runner.invoke(cli, ["list"])
     assert result.exit_code == 0
     assert "No tasks found" in result.stdout
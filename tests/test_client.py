@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterator, Tuple
 
 import json
 import httpx
@@ -37,41 +37,61 @@ def _sample_task(**overrides: Any) -> Dict[str, Any]:
     return payload
 
 
-def _client_with_handler(handler: httpx.MockTransport) -> TaskClient:
-    return TaskClient(base_url="http://testserver", transport=handler)
+Handler = Callable[[httpx.Request], httpx.Response]
+Routes = Dict[Tuple[str, str], Handler]
 
 
-def test_client_get_next_task() -> None:
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "GET"
-        assert request.url.path == "/api/tasks/next"
-        return httpx.Response(200, json=_sample_task(id="task-123"))
+@pytest.fixture(scope="module")
+def _routes() -> Routes:
+    """Handlers keyed by ``(method, path)`` for the shared mock transport."""
+    return {}
+
+
+@pytest.fixture(scope="module")
+def client(_routes: Routes) -> Iterator[TaskClient]:
+    """One TaskClient for the module, dispatching requests through ``_routes``."""
+
+    def dispatch(request: httpx.Request) -> httpx.Response:
+        handler = _routes.get((request.method, request.url.path))
+        if handler is None:
+            pytest.fail(f"Unexpected request: {request.method} {request.url.path}")
+        return handler(request)
+
+    task_client = TaskClient(base_url="http://testserver", transport=httpx.MockTransport(dispatch))
+    yield task_client
+    task_client.close()
+
+
+@pytest.fixture()
+def routes(_routes: Routes) -> Iterator[Routes]:
+    """Register this test's handlers; they are cleared again on teardown."""
+    yield _routes
+    _routes.clear()
+
+
+def test_client_get_next_task(client: TaskClient, routes: Routes) -> None:
+    routes["GET", "/api/tasks/next"] = lambda request: httpx.Response(
+        200, json=_sample_task(id="task-123")
+    )
 
-    client = _client_with_handler(httpx.MockTransport(handler))
     task = client.get_next_task()
     assert task.id == "task-123"
-    client.close()
 
 
-def test_client_mark_in_progress() -> None:
+def test_client_mark_in_progress(client: TaskClient, routes: Routes) -> None:
     def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "POST"
-        assert request.url.path == "/api/tasks/task-001/status"
         body = json.loads(request.content.decode())
         assert body["status"] == TaskStatus.IN_PROGRESS.value
         assert body["author"] == "codex"
         return httpx.Response(200, json=_sample_task(status=TaskStatus.IN_PROGRESS.value))
 
-    client = _client_with_handler(httpx.MockTransport(handler))
+    routes["POST", "/api/tasks/task-001/status"] = handler
     task = client.mark_in_progress("task-001", agent="codex", summary="Working")
     assert task.status == TaskStatus.IN_PROGRESS.value
-    client.close()
 
 
-def test_client_add_progress_update() -> None:
+def test_client_add_progress_update(client: TaskClient, routes: Routes) -> None:
     def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "POST"
-        assert request.url.path == "/api/tasks/task-001/progress"
         body = json.loads(request.content.decode())
         assert body["summary"] == "Updated"
 
@@ -89,40 +109,34 @@ def test_client_add_progress_update() -> None:
             ),
         )
 
-    client = _client_with_handler(httpx.MockTransport(handler))
+    routes["POST", "/api/tasks/task-001/progress"] = handler
     task = client.add_progress_update("task-001", summary="Updated", agent="codex")
     assert task.status_updates
-    client.close()
 
 
-def test_client_mark_completed() -> None:
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.method == "POST"
-        assert request.url.path == "/api/tasks/task-001/status"
-        return httpx.Response(200, json=_sample_task(status=TaskStatus.COMPLETED.value))
+def test_client_mark_completed(client: TaskClient, routes: Routes) -> None:
+    routes["POST", "/api/tasks/task-001/status"] = lambda request: httpx.Response(
+        200, json=_sample_task(status=TaskStatus.COMPLETED.value)
+    )
 
-    client = _client_with_handler(httpx.MockTransport(handler))
     task = client.mark_completed("task-001", summary="Done")
     assert task.status == TaskStatus.COMPLETED.value
-    client.close()
 
 
-def test_client_connection_error() -> None:
+def test_client_connection_error(client: TaskClient, routes: Routes) -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ConnectError("boom", request=request)
 
-    client = _client_with_handler(httpx.MockTransport(handler))
+    routes["GET", "/api/tasks/task-001"] = handler
     with pytest.raises(TaskClientError):
         client.get_task("task-001")
-    client.close()
 
 
-def test_client_404_error() -> None:
-    def handler(request: httpx.Request) -> httpx.Response:
-        return httpx.Response(404, json={"detail": "Task not found"})
+def test_client_404_error(client: TaskClient, routes: Routes) -> None:
+    routes["GET", "/api/tasks/missing"] = lambda request: httpx.Response(
+        404, json={"detail": "Task not found"}
+    )
 
-    client = _client_with_handler(httpx.MockTransport(handler))
     with pytest.raises(TaskClientError) as excinfo:
         client.get_task("missing")
     assert "Task not found" in str(excinfo.value)
-    client.close()
@@ -2,18 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 from fastapi.testclient import TestClient
 
 from agentjobs.api.main import app
 from agentjobs.api.dependencies import reset_dependency_cache
-from agentjobs.manager import TaskManager
-from agentjobs.models import TaskStatus
-from agentjobs.storage import TaskStorage, WebhookStorage
-from agentjobs.webhooks import WebhookManager
 
 
 @pytest.fixture(autouse=True)
@@ -27,15 +23,23 @@ def setup_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("AGENTJOBS_PROJECT_ROOT", str(tmp_path))
     monkeypatch.setenv("AGENTJOBS_TASKS_DIR", str(tasks_dir))
 
+    # Dependencies are cached without regard to the environment, so each test
+    # drops the previous test's storage; the module client clears the last one.
     reset_dependency_cache()
-    yield
+
+
+@pytest.fixture(scope="module")
+def _app_client() -> Iterator[TestClient]:
+    """Enter the app (and its lifespan) once for every test in this module."""
+    with TestClient(app) as client:
+        yield client
     reset_dependency_cache()
 
 
 @pytest.fixture
-def client() -> TestClient:
-    """Create a test client for the API."""
-    return TestClient(app)
+def client(_app_client: TestClient) -> TestClient:
+    """Return the shared test client; storage follows this test's environment."""
+    return _app_client
 
 
 @pytest.fixture
@@ -7,14 +7,15 @@ from textwrap import dedent
 
 import pytest
 
+from agentjobs.migration import migrate_tasks
 from agentjobs.migration.converter import TaskConverter
-from agentjobs.migration.parser import MarkdownTaskParser
+from agentjobs.migration.parser import MarkdownTaskParser, ParsedTask
 from agentjobs.models import Priority, TaskStatus
 
 
-@pytest.fixture
-def sample_markdown(tmp_path: Path) -> Path:
-    """Create sample markdown task file."""
+@pytest.fixture(scope="session")
+def sample_markdown(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the sample markdown task file once; tests must not modify it."""
     content = dedent(
         """
         # Task 016: Feature Implementation
@@ -44,11 +45,17 @@ def sample_markdown(tmp_path: Path) -> Path:
         """
     ).strip()
 
-    task_file = tmp_path / "task-016-feature.md"
+    task_file = tmp_path_factory.mktemp("md") / "task-016-feature.md"
     task_file.write_text(content, encoding="utf-8")
     return task_file
 
 
+@pytest.fixture(scope="session")
+def parsed_sample(sample_markdown: Path) -> ParsedTask:
+    """Parse the sample markdown once for the tests that only convert it."""
+    return MarkdownTaskParser().parse_file(sample_markdown)
+
+
 def test_parse_markdown_task(sample_markdown: Path) -> None:
     """Test parsing markdown task file."""
     parser = MarkdownTaskParser()
@@ -67,13 +74,9 @@ def test_parse_markdown_task(sample_markdown: Path) -> None:
     assert parsed.human_summary.startswith("Build a new feature")
 
 
-def test_convert_to_yaml_task(sample_markdown: Path) -> None:
+def test_convert_to_yaml_task(parsed_sample: ParsedTask) -> None:
     """Test converting parsed task to YAML-compatible model."""
-    parser = MarkdownTaskParser()
-    converter = TaskConverter()
-
-    parsed = parser.parse_file(sample_markdown)
-    task = converter.convert(parsed)
+    task = TaskConverter().convert(parsed_sample)
 
     assert task.id == "task-016-feature"
     assert task.status == TaskStatus.COMPLETED
@@ -87,3 +90,38 @@ def test_convert_to_yaml_task(sample_markdown: Path) -> None:
     assert task.deliverables[0].status == "completed"
     assert task.prompts.starter
     assert "Build a new feature" in task.human_summary
+
+
+def test_clean_markdown_strips_inline_markup() -> None:
+    """Inline code, bold, and italic markers are removed, including nested spans."""
+    clean = MarkdownTaskParser._clean_markdown
+
+    assert clean("  **Core** `api` *docs*  ") == "Core api docs"
+    assert clean("**`nested`** span") == "nested span"
+    assert clean("a*b") == "a*b"
+
+
+def test_convert_links_starter_prompt(parsed_sample: ParsedTask, tmp_path: Path) -> None:
+    """The first matching prompt file becomes the starter prompt."""
+    prompts_dir = tmp_path / "prompts"
+    prompts_dir.mkdir()
+    (prompts_dir / "task-016-b-followup.md").write_text("Second", encoding="utf-8")
+    (prompts_dir / "task-016-a-kickoff.md").write_text("First", encoding="utf-8")
+    (prompts_dir / "task-017-a-other.md").write_text("Other", encoding="utf-8")
+
+    task = TaskConverter().convert(parsed_sample, prompts_dir=prompts_dir)
+
+    assert task.prompts.starter == "First"
+
+
+def test_migrate_tasks_reports_failed_write(sample_markdown: Path, tmp_path: Path) -> None:
+    """A task that cannot be written is reported as failed instead of raising."""
+    [preview] = migrate_tasks([str(sample_markdown)], tmp_path, dry_run=True)
+    (tmp_path / f"{preview.task_id}.yaml").mkdir()
+
+    [result] = migrate_tasks([str(sample_markdown)], tmp_path)
+
+    assert result.success is False
+    assert result.target_file is None
+    [error] = result.errors
+    assert error.startswith(f"Failed to save task {preview.task_id}:")
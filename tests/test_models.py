@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Any, Dict, Type, get_args
 
 import pytest
+from pydantic import BaseModel
 
 from agentjobs.models import (
     Branch,
@@ -15,86 +17,143 @@ from agentjobs.models import (
     Prompts,
     SuccessCriterion,
     Task,
+    TaskField,
     TaskStatus,
 )
 
 
-def _now() -> datetime:
-    return datetime.now(tz=timezone.utc)
+_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
 
 
-def test_task_model_helper_methods() -> None:
+@pytest.mark.parametrize(
+    ("status", "completed", "blocked", "active"),
+    [
+        (TaskStatus.COMPLETED, True, False, False),
+        (TaskStatus.BLOCKED, False, True, True),
+        (TaskStatus.WAITING_FOR_HUMAN, False, False, True),
+    ],
+    ids=["completed", "blocked", "waiting-for-human"],
+)
+def test_task_model_helper_methods(
+    status: TaskStatus, completed: bool, blocked: bool, active: bool
+) -> None:
     """Task helper methods reflect workflow state."""
     task = Task(
         id="task-001",
         title="Test Task",
-        created=_now(),
-        updated=_now(),
-        status=TaskStatus.COMPLETED,
+        created=_NOW,
+        updated=_NOW,
+        status=status,
         priority=Priority.HIGH,
         category="testing",
         description="Ensure helper methods behave as expected.",
+        human_summary="Needs product approval.",
     )
 
-    assert task.is_completed() is True
-    assert task.is_blocked() is False
-    assert task.is_active() is False
+    assert task.is_completed() is completed
+    assert task.is_blocked() is blocked
+    assert task.is_active() is active
     assert task.priority_rank() == 1
-
-    task.status = TaskStatus.BLOCKED
-    assert task.is_blocked() is True
-    assert task.is_active() is True
-
-    task.status = TaskStatus.WAITING_FOR_HUMAN
-    task.human_summary = "Needs product approval."
-    assert task.is_active() is True
     assert task.human_summary == "Needs product approval."
 
 
-def test_success_criterion_validation() -> None:
-    """Success criterion enforces supported states."""
-    criterion = SuccessCriterion(
-        id="sc-1",
-        description="All tests green",
-        status="completed",
+def test_task_helpers_follow_status_changes() -> None:
+    """Helpers read the current status, so reassigning it is reflected at once."""
+    task = Task(
+        id="task-001",
+        title="Test Task",
+        created=_NOW,
+        updated=_NOW,
+        status=TaskStatus.COMPLETED,
+        category="testing",
+        description="Status changes after construction.",
     )
-    assert criterion.status == "completed"
-
-    with pytest.raises(ValueError):
-        SuccessCriterion(id="sc-2", description="Invalid", status="unknown")
 
+    task.status = TaskStatus.BLOCKED
+    assert task.is_completed() is False
+    assert task.is_blocked() is True
 
-def test_deliverable_validation() -> None:
-    """Deliverable status is constrained."""
-    deliverable = Deliverable(path="docs/report.md", status="pending")
-    assert deliverable.status == "pending"
 
-    with pytest.raises(ValueError):
-        Deliverable(path="docs/report.md", status="blocked")
+@pytest.mark.parametrize(
+    ("model", "fields", "name", "expected"),
+    [
+        pytest.param(
+            SuccessCriterion,
+            {"id": "sc-1", "description": "All tests green", "status": "completed"},
+            "status",
+            "completed",
+            id="success-criterion",
+        ),
+        pytest.param(
+            Deliverable,
+            {"path": "docs/report.md", "status": "pending"},
+            "status",
+            "pending",
+            id="deliverable",
+        ),
+        pytest.param(Dependency, {"task_id": "task-1"}, "type", "depends_on", id="dependency"),
+        pytest.param(Branch, {"name": "feature/test"}, "status", "active", id="branch"),
+        pytest.param(
+            Issue,
+            {"id": "issue-1", "title": "Bug", "status": "resolved"},
+            "status",
+            "resolved",
+            id="issue",
+        ),
+    ],
+)
+def test_constrained_fields_accept_supported_values(
+    model: Type[BaseModel], fields: Dict[str, Any], name: str, expected: str
+) -> None:
+    """Constrained fields keep supported values and apply their defaults."""
+    assert getattr(model(**fields), name) == expected
+
+
+@pytest.mark.parametrize(
+    ("model", "fields", "name"),
+    [
+        pytest.param(
+            SuccessCriterion,
+            {"id": "sc-2", "description": "Invalid", "status": "unknown"},
+            "status",
+            id="success-criterion",
+        ),
+        pytest.param(
+            Deliverable,
+            {"path": "docs/report.md", "status": "blocked"},
+            "status",
+            id="deliverable",
+        ),
+        pytest.param(
+            Dependency, {"task_id": "task-1", "type": "invalid"}, "type", id="dependency"
+        ),
+        pytest.param(Branch, {"name": "feature/test", "status": "stale"}, "status", id="branch"),
+        pytest.param(
+            Issue,
+            {"id": "issue-2", "title": "Bug", "status": "invalid"},
+            "status",
+            id="issue",
+        ),
+    ],
+)
+def test_constrained_fields_reject_unsupported_values(
+    model: Type[BaseModel], fields: Dict[str, Any], name: str
+) -> None:
+    """Constrained fields reject values outside their allowed set, naming the field."""
+    with pytest.raises(ValueError, match=rf"(?m)^{name}$"):
+        model(**fields)
 
 
-def test_dependency_and_branch_validation() -> None:
-    """Derived models validate their enumerated fields."""
-    dependency = Dependency(task_id="task-1")
-    assert dependency.type == "depends_on"
+def test_leaf_models_are_frozen() -> None:
+    """Leaf value objects reject mutation and hash by value."""
+    deliverable = Deliverable(path="docs/report.md")
 
     with pytest.raises(ValueError):
-        Dependency(task_id="task-1", type="invalid")
-
-    branch = Branch(name="feature/test")
-    assert branch.status == "active"
+        deliverable.status = "completed"
 
-    with pytest.raises(ValueError):
-        Branch(name="feature/test", status="stale")
-
-
-def test_issue_status_validation() -> None:
-    """Issue status validator rejects unsupported values."""
-    issue = Issue(id="issue-1", title="Bug", status="resolved")
-    assert issue.status == "resolved"
-
-    with pytest.raises(ValueError):
-        Issue(id="issue-2", title="Bug", status="invalid")
+    assert deliverable == Deliverable(path="docs/report.md")
+    assert len({deliverable, Deliverable(path="docs/report.md")}) == 1
+    assert deliverable.model_copy(update={"status": "completed"}).status == "completed"
 
 
 def test_task_serialization_handles_prompts() -> None:
@@ -105,8 +164,8 @@ def test_task_serialization_handles_prompts() -> None:
     task = Task(
         id="task-010",
         title="Serialization",
-        created=_now(),
-        updated=_now(),
+        created=_NOW,
+        updated=_NOW,
         category="infra",
         description="Serialize me",
         prompts=prompts,
@@ -116,3 +175,8 @@ def test_task_serialization_handles_prompts() -> None:
     assert payload["prompts"]["starter"] == starter
     assert payload["status"] == TaskStatus.DRAFT.value
     assert payload["priority"] == Priority.MEDIUM.value
+
+
+def test_task_field_names_match_task_model() -> None:
+    """TaskField lists exactly the Task model's top-level fields."""
+    assert list(get_args(TaskField)) == list(Task.model_fields)
@@ -2,27 +2,32 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
 from agentjobs.models import Priority, Task, TaskStatus
-from agentjobs.storage import TaskStorage
+from agentjobs.storage import INDEX_FILENAME, TaskSaveError, TaskStorage
+
+
+_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+# Validated once; variants only differ in id/title, so deep copies skip validation.
+_TEMPLATE = Task(
+    id="task-template",
+    title="Sample",
+    created=_NOW,
+    updated=_NOW,
+    status=TaskStatus.READY,
+    priority=Priority.MEDIUM,
+    category="testing",
+    description="Task description",
+)
 
 
 def _build_task(task_id: str, title: str = "Sample") -> Task:
-    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
-    return Task(
-        id=task_id,
-        title=title,
-        created=now,
-        updated=now,
-        status=TaskStatus.READY,
-        priority=Priority.MEDIUM,
-        category="testing",
-        description="Task description",
-    )
+    return _TEMPLATE.model_copy(update={"id": task_id, "title": title}, deep=True)
 
 
 def test_save_and_load_roundtrip(tmp_path: Path) -> None:
@@ -68,6 +73,47 @@ def test_list_and_search_tasks(tmp_path: Path) -> None:
     assert matches[0].id == "task-002"
 
 
+def test_save_tasks_bulk_shares_timestamp(tmp_path: Path) -> None:
+    """Bulk saves write every task with a single updated timestamp."""
+    storage = TaskStorage(tmp_path)
+    saved = storage.save_tasks_bulk(
+        [_build_task("task-001"), _build_task("task-002")]
+    )
+
+    assert [task.id for task in saved] == ["task-001", "task-002"]
+    assert saved[0].updated == saved[1].updated
+    assert [task.id for task in storage.list_tasks()] == ["task-001", "task-002"]
+
+
+def test_save_tasks_bulk_is_all_or_nothing(tmp_path: Path) -> None:
+    """A batch that fails part-way leaves no task or temporary files behind."""
+    storage = TaskStorage(tmp_path)
+
+    def tasks():
+        yield _build_task("task-001")
+        raise RuntimeError("source exhausted")
+
+    with pytest.raises(RuntimeError):
+        storage.save_tasks_bulk(tasks())
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_save_tasks_bulk_reports_failed_task(tmp_path: Path) -> None:
+    """A file that cannot be replaced is named along with the tasks already written."""
+    storage = TaskStorage(tmp_path)
+    (tmp_path / "task-002.yaml").mkdir()
+
+    with pytest.raises(TaskSaveError) as excinfo:
+        storage.save_tasks_bulk(
+            [_build_task("task-001"), _build_task("task-002"), _build_task("task-003")]
+        )
+
+    assert excinfo.value.task_id == "task-002"
+    assert excinfo.value.written == ["task-001"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["task-001.yaml", "task-002.yaml"]
+
+
 def test_delete_task(tmp_path: Path) -> None:
     """Deleting a task removes its YAML file."""
     storage = TaskStorage(tmp_path)
@@ -76,3 +122,95 @@ def test_delete_task(tmp_path: Path) -> None:
     assert storage.delete_task("task-050") is True
     assert storage.load_task("task-050") is None
     assert storage.delete_task("task-050") is False
+
+
+def test_list_tasks_index_tracks_disk_changes(tmp_path: Path) -> None:
+    """The task index is written on listing and never hides edits or deletes."""
+    storage = TaskStorage(tmp_path)
+    storage.save_task(_build_task("task-001", title="Original"))
+    storage.save_task(_build_task("task-002", title="Second"))
+
+    assert [task.title for task in storage.list_tasks()] == ["Original", "Second"]
+    assert (tmp_path / INDEX_FILENAME).exists()
+
+    # Same-size edit made outside AgentJobs, then a deletion.
+    path = tmp_path / "task-001.yaml"
+    path.write_text(
+        path.read_text(encoding="utf-8").replace("Original", "Modified"),
+        encoding="utf-8",
+    )
+    (tmp_path / "task-002.yaml").unlink()
+
+    assert [task.title for task in TaskStorage(tmp_path).list_tasks()] == ["Modified"]
+    assert [task.title for task in storage.list_tasks()] == ["Modified"]
+
+    (tmp_path / INDEX_FILENAME).write_text("not json", encoding="utf-8")
+    storage.rebuild_index()
+    assert [task.title for task in storage.list_tasks()] == ["Modified"]
+
+
+def test_list_tasks_falls_back_to_yaml_for_invalid_index_entries(tmp_path: Path) -> None:
+    """An index entry that no longer validates is re-read from its YAML file."""
+    storage = TaskStorage(tmp_path)
+    storage.save_task(_build_task("task-001", title="First"))
+    storage.save_task(_build_task("task-002", title="Second"))
+    storage.list_tasks()
+
+    index_path = tmp_path / INDEX_FILENAME
+    payload = json.loads(index_path.read_text(encoding="utf-8"))
+    payload["tasks"]["task-001"]["task"]["status"] = "retired"
+    index_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    tasks = TaskStorage(tmp_path).list_tasks()
+    assert [(task.id, task.status) for task in tasks] == [
+        ("task-001", TaskStatus.READY),
+        ("task-002", TaskStatus.READY),
+    ]
+
+
+def test_load_task_reuses_index_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    """Loading an unchanged task skips YAML; an outside edit is still seen."""
+    storage = TaskStorage(tmp_path)
+    storage.list_tasks()
+    storage.save_task(_build_task("task-001", title="Original"))
+
+    read_task = storage._read_task
+    reads = []
+    monkeypatch.setattr(storage, "_read_task", lambda path: reads.append(path) or read_task(path))
+
+    assert storage.load_task("task-001").title == "Original"
+    assert reads == []
+
+    path = tmp_path / "task-001.yaml"
+    path.write_text(
+        path.read_text(encoding="utf-8").replace("Original", "Edited"),
+        encoding="utf-8",
+    )
+    assert storage.load_task("task-001").title == "Edited"
+    assert reads == [path]
+
+
+def test_search_tasks_matches_substrings_via_index(tmp_path: Path) -> None:
+    """Indexed search keeps substring semantics across word boundaries."""
+    storage = TaskStorage(tmp_path)
+    storage.save_task(_build_task("task-001", title="Implement caching layer"))
+    storage.save_task(_build_task("task-002", title="Write docstrings"))
+
+    assert [task.id for task in storage.search_tasks("docs")] == ["task-002"]
+    assert [task.id for task in storage.search_tasks("ent cach")] == ["task-001"]
+    assert [task.id for task in storage.search_tasks("TASK DESC")] == ["task-001", "task-002"]
+    assert storage.search_tasks("caching docs") == []
+
+    storage.save_task(_build_task("task-002", title="Write guides"))
+    assert storage.search_tasks("docs") == []
+
+
+def test_generate_task_id_uses_highest_numbered_file(tmp_path: Path) -> None:
+    """Only plain numbered task files advance the generated identifier."""
+    storage = TaskStorage(tmp_path)
+    assert storage.generate_task_id() == "task-001"
+
+    storage.save_task(_build_task("task-007"))
+    storage.save_task(_build_task("task-042-named-slug"))
+    (tmp_path / "task-100.yml").write_text("", encoding="utf-8")
+    assert storage.generate_task_id() == "task-008"
@@ -2,28 +2,40 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import hmac
+import json
+import threading
+import time
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
 
 import pytest
+from pydantic import ValidationError
 
-from agentjobs.models import Task, TaskStatus, Webhook
+from agentjobs.models import Task, TaskStatus
 from agentjobs.storage import TaskStorage, WebhookStorage
 from agentjobs.manager import TaskManager
+from agentjobs import webhooks as webhooks_module
 from agentjobs.webhooks import WebhookManager
 
 
 @pytest.fixture
 def webhook_storage(tmp_path: Path) -> WebhookStorage:
     """Create a temporary webhook storage."""
-    webhooks_path = tmp_path / "webhooks.yaml"
+    webhooks_path = tmp_path / "webhooks.jsonl"
     return WebhookStorage(webhooks_path)
 
 
 @pytest.fixture
-def webhook_manager(webhook_storage: WebhookStorage) -> WebhookManager:
-    """Create a webhook manager."""
-    return WebhookManager(webhook_storage)
+def webhook_manager(webhook_storage: WebhookStorage) -> Iterator[WebhookManager]:
+    """Create a webhook manager, closing its dispatch loop afterwards."""
+    manager = WebhookManager(webhook_storage)
+    yield manager
+    manager.close()
 
 
 @pytest.fixture
@@ -55,20 +67,38 @@ def test_create_webhook(webhook_manager: WebhookManager) -> None:
 
 def test_list_webhooks(webhook_manager: WebhookManager) -> None:
     """Test listing webhooks."""
-    webhook_manager.create_webhook(
-        url="http://localhost:5000/webhook1",
-        events=["task.created"],
-        secret="secret1",
-    )
-    webhook_manager.create_webhook(
-        url="http://localhost:5000/webhook2",
-        events=["task.completed"],
-        secret="secret2",
+    webhook_manager.create_webhooks(
+        [
+            {
+                "url": "http://localhost:5000/webhook1",
+                "events": ["task.created"],
+                "secret": "secret1",
+            },
+            {
+                "url": "http://localhost:5000/webhook2",
+                "events": ["task.completed"],
+                "secret": "secret2",
+            },
+        ]
     )
     webhooks = webhook_manager.list_webhooks()
     assert len(webhooks) == 2
 
 
+def test_create_webhooks_stores_nothing_if_any_spec_is_invalid(
+    webhook_manager: WebhookManager,
+) -> None:
+    """A bulk create validates every spec before writing any of them."""
+    with pytest.raises(ValidationError):
+        webhook_manager.create_webhooks(
+            [
+                {"url": "http://localhost:5000/ok", "events": ["task.created"], "secret": "s"},
+                {"url": "not a url", "events": ["task.created"], "secret": "s"},
+            ]
+        )
+    assert webhook_manager.list_webhooks() == []
+
+
 def test_get_webhook(webhook_manager: WebhookManager) -> None:
     """Test getting a webhook by ID."""
     webhook = webhook_manager.create_webhook(
@@ -95,18 +125,19 @@ def test_delete_webhook(webhook_manager: WebhookManager) -> None:
     assert retrieved is None
 
 
-def test_webhook_persistence(webhook_storage: WebhookStorage) -> None:
+def test_webhook_persistence(
+    webhook_manager: WebhookManager, webhook_storage: WebhookStorage
+) -> None:
     """Test that webhooks persist across manager instances."""
-    manager1 = WebhookManager(webhook_storage)
-    webhook = manager1.create_webhook(
+    webhook = webhook_manager.create_webhook(
         url="http://localhost:5000/webhook",
         events=["task.created"],
         secret="test-secret",
     )
 
-    # Create new manager with same storage
-    manager2 = WebhookManager(webhook_storage)
-    retrieved = manager2.get_webhook(webhook.id)
+    # Create new manager with same storage; it never dispatches, so owns no loop.
+    other = WebhookManager(webhook_storage)
+    retrieved = other.get_webhook(webhook.id)
     assert retrieved is not None
     assert retrieved.id == webhook.id
 
@@ -140,3 +171,397 @@ def test_task_manager_fires_webhook_on_status_change(
 
     # Just verify the method completes without error
     assert True
+
+
+def test_webhook_log_appends_and_compacts(webhook_storage: WebhookStorage) -> None:
+    """Saves and deletes append to the log until superseded lines reach the threshold."""
+    webhook = webhook_storage.create_webhook(
+        url="http://localhost:5000/webhook",
+        events=["task.created"],
+        secret="test-secret",
+    )
+    doomed = webhook_storage.create_webhook(
+        url="http://localhost:5000/other",
+        events=["task.created"],
+        secret="test-secret",
+    )
+    assert webhook_storage.delete_webhook(doomed.id) is True
+    assert webhook_storage.delete_webhook(doomed.id) is False
+
+    log = webhook_storage.webhooks_path
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 3
+
+    for _ in range(WebhookStorage.COMPACT_THRESHOLD - 3):
+        webhook.record_trigger()
+        webhook_storage.save_webhook(webhook)
+    assert len(log.read_text(encoding="utf-8").splitlines()) == WebhookStorage.COMPACT_THRESHOLD
+
+    webhook.record_trigger()
+    webhook_storage.save_webhook(webhook)
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 1
+    assert [hook.id for hook in webhook_storage.list_webhooks()] == [webhook.id]
+    assert webhook_storage.get_webhook(webhook.id).last_triggered is not None
+
+
+def test_webhook_storage_reads_legacy_yaml(tmp_path: Path) -> None:
+    """A webhooks file in the old YAML list format is read as-is and converted on write."""
+    legacy = tmp_path / "webhooks.jsonl"
+    legacy.write_text(
+        "- id: wh_legacy\n"
+        "  url: http://localhost:5000/webhook\n"
+        "  events: [task.created]\n"
+        "  secret: s3cret\n"
+        "  active: true\n"
+        "  created: '2025-01-01T00:00:00Z'\n",
+        encoding="utf-8",
+    )
+    storage = WebhookStorage(legacy)
+    assert storage.get_webhook("wh_legacy") is not None
+    assert [hook.id for hook in storage.list_webhooks()] == ["wh_legacy"]
+    assert legacy.read_text(encoding="utf-8").startswith("- id: wh_legacy")
+
+    storage.create_webhook(url="http://localhost:5000/new", events=[], secret="x")
+    lines = legacy.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert all(line.startswith("{") for line in lines)
+
+
+def test_webhook_cache_sees_other_writers(webhook_storage: WebhookStorage) -> None:
+    """A cached storage picks up webhooks written through another instance."""
+    first = webhook_storage.create_webhook(
+        url="http://localhost:5000/webhook",
+        events=["task.created"],
+        secret="test-secret",
+    )
+    assert webhook_storage.get_webhook(first.id) is not None
+
+    other = WebhookStorage(webhook_storage.webhooks_path)
+    second = other.create_webhook(
+        url="http://localhost:5000/other",
+        events=["task.created"],
+        secret="test-secret",
+    )
+    other.delete_webhook(first.id)
+
+    assert webhook_storage.get_webhook(first.id) is None
+    assert [hook.id for hook in webhook_storage.list_webhooks()] == [second.id]
+
+
+def test_event_index_tracks_webhook_changes(
+    webhook_manager: WebhookManager, webhook_storage: WebhookStorage
+) -> None:
+    """Event subscribers follow creates, deletes, and other writers."""
+    created = webhook_manager.create_webhook(
+        url="http://localhost:5000/webhook",
+        events=["task.created", "task.created"],
+        secret="test-secret",
+    )
+    webhook_manager.create_webhook(
+        url="http://localhost:5000/inactive",
+        events=["task.created"],
+        secret="test-secret",
+        active=False,
+    )
+    assert [hook.id for hook in webhook_manager._subscribers("task.created")] == [created.id]
+    assert webhook_manager._subscribers("task.completed") == []
+
+    other = WebhookStorage(webhook_storage.webhooks_path)
+    completed = other.create_webhook(
+        url="http://localhost:5000/other",
+        events=["task.completed"],
+        secret="test-secret",
+    )
+    assert [hook.id for hook in webhook_manager._subscribers("task.completed")] == [
+        completed.id
+    ]
+
+    webhook_manager.delete_webhook(created.id)
+    assert webhook_manager._subscribers("task.created") == []
+
+
+def test_compute_signature_matches_fresh_hmac(webhook_manager: WebhookManager) -> None:
+    """Signatures from the cached HMAC template match a freshly keyed HMAC."""
+    for payload in (b'{"event":"a"}', b'{"event":"b"}', b'{"event":"a"}'):
+        expected = hmac.new(b"test-secret", payload, hashlib.sha256).hexdigest()
+        assert webhook_manager._compute_signature(payload, "test-secret") == expected
+
+
+Received = Tuple[str, bytes, Dict[str, str]]
+
+
+@pytest.fixture(scope="module")
+def _receiver_server() -> Iterator[Tuple[str, List[Received]]]:
+    """Run one local HTTP server per module, recording (path, body, headers) per POST.
+
+    Shared because ``server.shutdown()`` waits out ``serve_forever``'s poll
+    interval, which would otherwise add half a second to every test.
+    """
+    received: List[Received] = []
+
+    class Receiver(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802 - http.server naming
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append((self.path, body, dict(self.headers)))
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Receiver)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", received
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def receiver(_receiver_server: Tuple[str, List[Received]]) -> Iterator[Tuple[str, List[Received]]]:
+    """Provide the shared receiver with an empty request log for this test."""
+    base_url, received = _receiver_server
+    received.clear()
+    yield base_url, received
+    received.clear()
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for webhook delivery"
+        time.sleep(0.01)
+
+
+def test_webhook_deliveries_share_client_until_closed(
+    webhook_manager: WebhookManager,
+    receiver: Tuple[str, List[Received]],
+) -> None:
+    """Deliveries reuse one HTTP client, and aclose() releases it."""
+    base_url, received = receiver
+    webhook = webhook_manager.create_webhook(
+        url=f"{base_url}/hook",
+        events=["task.created"],
+        secret="test-secret",
+    )
+    webhook_manager.test_webhook(webhook.id)
+    client = webhook_manager._client
+    webhook_manager.test_webhook(webhook.id)
+
+    assert len(received) == 2
+    _, body, headers = received[0]
+    assert headers["Content-Type"] == "application/json"
+    expected = hmac.new(b"test-secret", body, hashlib.sha256).hexdigest()
+    assert headers["X-Hub-Signature-256"] == f"sha256={expected}"
+    assert client is not None and webhook_manager._client is client
+    assert webhook_manager.get_webhook(webhook.id).last_triggered is not None
+
+    asyncio.run(webhook_manager.aclose())
+    assert client.is_closed
+    assert webhook_manager._client is None
+
+
+def test_close_stops_dispatch_loop(webhook_manager: WebhookManager) -> None:
+    """close() releases the dispatch loop without needing an event loop."""
+    loop = webhook_manager._dispatch_loop()
+
+    webhook_manager.close()
+
+    assert webhook_manager._loop is None
+    deadline = time.monotonic() + 1.0
+    while not loop.is_closed() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert loop.is_closed()
+
+
+def test_fire_event_fans_out_past_failing_receivers(
+    task_manager: TaskManager,
+    webhook_manager: WebhookManager,
+    receiver: Tuple[str, List[Received]],
+) -> None:
+    """One unreachable subscriber does not stop delivery to the others."""
+    base_url, received = receiver
+    webhook_manager.create_webhook(
+        url="http://127.0.0.1:9/unreachable",
+        events=["task.status_changed"],
+        secret="test-secret",
+    )
+    for name in ("first", "second"):
+        webhook_manager.create_webhook(
+            url=f"{base_url}/{name}",
+            events=["task.status_changed"],
+            secret="test-secret",
+        )
+    task = task_manager.create_task(
+        title="Test Task", description="Test description", category="test"
+    )
+
+    task_manager.update_status(
+        task_id=task.id,
+        status=TaskStatus.IN_PROGRESS,
+        author="test-user",
+        summary="Starting work",
+    )
+
+    _wait_for(lambda: len(received) == 2)
+    assert sorted(path for path, _, _ in received) == ["/first", "/second"]
+    assert received[0][1] == received[1][1]
+
+
+def test_dump_payload_is_compact_sorted_utf8(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Payload bytes are identical with and without orjson installed."""
+    payload = {"task": {"title": "Café", "tags": ["a"]}, "event": "task.created"}
+    expected = '{"event":"task.created","task":{"tags":["a"],"title":"Café"}}'.encode()
+
+    assert webhooks_module._dump_payload(payload) == expected
+    monkeypatch.setattr(webhooks_module, "orjson", None)
+    assert webhooks_module._dump_payload(payload) == expected
+
+
+def test_build_payload_splices_task_json(webhook_manager: WebhookManager) -> None:
+    """The serialized task is spliced into the sorted envelope unchanged."""
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    task = Task(
+        id="task-001",
+        title="Café",
+        created=now,
+        updated=now,
+        category="test",
+        description="Test description",
+    )
+    payload = webhook_manager._build_payload(
+        event="task.created", task=task, metadata={"triggered_by": "jeff"}
+    )
+
+    data = json.loads(payload)
+    assert list(data) == ["event", "task", "timestamp", "triggered_by"]
+    assert data["task"] == task.model_dump(mode="json")
+    assert b'"title":"Caf\xc3\xa9"' in payload
+
+
+def test_utc_timestamp_matches_isoformat() -> None:
+    """Cached-prefix timestamps parse back to the current UTC time."""
+    before = datetime.now(timezone.utc)
+    first = datetime.fromisoformat(webhooks_module._utc_timestamp())
+    second = datetime.fromisoformat(webhooks_module._utc_timestamp())
+    after = datetime.now(timezone.utc)
+
+    assert before <= first <= second <= after
+    assert first.tzinfo == timezone.utc
+
+
+def test_record_triggers_updates_current_records(webhook_storage: WebhookStorage) -> None:
+    """Trigger stamps land in one append and never revive or revert webhooks."""
+    kept = webhook_storage.create_webhook(
+        url="http://localhost:5000/kept", events=["task.created"], secret="s"
+    )
+    deleted = webhook_storage.create_webhook(
+        url="http://localhost:5000/deleted", events=["task.created"], secret="s"
+    )
+    webhook_storage.save_webhook(kept.model_copy(update={"active": False}))
+    webhook_storage.delete_webhook(deleted.id)
+    lines_before = len(webhook_storage.webhooks_path.read_text(encoding="utf-8").splitlines())
+
+    when = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    webhook_storage.record_triggers({kept.id: when, deleted.id: when})
+
+    lines_after = len(webhook_storage.webhooks_path.read_text(encoding="utf-8").splitlines())
+    assert lines_after == lines_before + 1
+    assert webhook_storage.get_webhook(deleted.id) is None
+    stamped = webhook_storage.get_webhook(kept.id)
+    assert stamped.last_triggered == when
+    assert stamped.active is False
+
+
+def test_record_triggers_keeps_revision(webhook_storage: WebhookStorage) -> None:
+    """Trigger stamps leave the revision alone; configuration changes move it."""
+    hook = webhook_storage.create_webhook(
+        url="http://localhost:5000/webhook", events=["task.created"], secret="s"
+    )
+    revision = webhook_storage.revision()
+
+    for day in range(1, 6):
+        when = datetime(2025, 1, day, tzinfo=timezone.utc)
+        webhook_storage.record_triggers({hook.id: when})
+        assert webhook_storage.revision() == revision
+    assert webhook_storage.get_webhook(hook.id).last_triggered == when
+
+    webhook_storage.delete_webhook(hook.id)
+    assert webhook_storage.revision() != revision
+
+
+def test_record_triggers_keeps_log_bounded(webhook_storage: WebhookStorage) -> None:
+    """Trigger stamps alone compact the log; nothing needs to list webhooks."""
+    hooks = [
+        webhook_storage.create_webhook(
+            url=f"http://localhost:5000/hook-{index}", events=["task.created"], secret="s"
+        )
+        for index in range(5)
+    ]
+    revision = webhook_storage.revision()
+    log = webhook_storage.webhooks_path
+
+    for minute in range(500):
+        when = datetime(2025, 1, 1, minute // 60, minute % 60, tzinfo=timezone.utc)
+        webhook_storage.revision()
+        webhook_storage.record_triggers({hook.id: when for hook in hooks})
+        line_count = len(log.read_text(encoding="utf-8").splitlines())
+        assert line_count < WebhookStorage.COMPACT_THRESHOLD + 2 * len(hooks)
+
+    assert webhook_storage.revision() == revision
+    assert webhook_storage.get_webhook(hooks[0].id).last_triggered == when
+
+
+def test_fire_event_limits_payload_to_selected_fields(
+    task_manager: TaskManager,
+    webhook_manager: WebhookManager,
+    receiver: Tuple[str, List[Received]],
+) -> None:
+    """Webhooks with a field list receive only those task fields."""
+    base_url, received = receiver
+    webhook_manager.create_webhook(
+        url=f"{base_url}/full",
+        events=["task.status_changed"],
+        secret="test-secret",
+    )
+    webhook_manager.create_webhook(
+        url=f"{base_url}/slim",
+        events=["task.status_changed"],
+        secret="test-secret",
+        fields=["id", "status"],
+    )
+    with pytest.raises(ValueError):
+        webhook_manager.create_webhook(
+            url=f"{base_url}/typo", events=[], secret="test-secret", fields=["stauts"]
+        )
+    task = task_manager.create_task(
+        title="Test Task", description="Test description", category="test"
+    )
+
+    task_manager.update_status(
+        task_id=task.id,
+        status=TaskStatus.IN_PROGRESS,
+        author="test-user",
+        summary="Starting work",
+    )
+
+    _wait_for(lambda: len(received) == 2)
+    tasks = {path: json.loads(body)["task"] for path, body, _ in received}
+    assert tasks["/slim"] == {"id": task.id, "status": "in_progress"}
+    assert tasks["/full"]["title"] == "Test Task"
+
+
+def test_webhook_without_secret_is_sent_unsigned(
+    webhook_manager: WebhookManager,
+    receiver: Tuple[str, List[Received]],
+) -> None:
+    """An empty secret skips signing and omits the signature header."""
+    base_url, received = receiver
+    webhook = webhook_manager.create_webhook(
+        url=f"{base_url}/unsigned", events=["task.created"], secret=""
+    )
+
+    webhook_manager.test_webhook(webhook.id)
+
+    assert len(received) == 1
+    assert "X-Hub-Signature-256" not in received[0][2]